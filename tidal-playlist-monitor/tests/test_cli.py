@@ -0,0 +1,41 @@
+"""Unit tests for CLI helper functions."""
+
+import pytest
+
+from tidal_playlist_monitor.cli import extract_playlist_id
+
+PLAYLIST_ID: str = "36ea71a8-445e-41a4-82ab-6628c581535d"
+
+
+class TestExtractPlaylistId:
+    """Test cases for extract_playlist_id function."""
+
+    def test_plain_id(self) -> None:
+        """Test that a bare ID is returned unchanged."""
+        assert extract_playlist_id(PLAYLIST_ID) == PLAYLIST_ID
+
+    def test_browse_url(self) -> None:
+        """Test extracting the ID from a browse URL."""
+        url: str = f"https://tidal.com/browse/playlist/{PLAYLIST_ID}"
+        assert extract_playlist_id(url) == PLAYLIST_ID
+
+    def test_share_url_with_query_string(self) -> None:
+        """Test extracting the ID from a share link with a query string."""
+        url: str = f"https://tidal.com/playlist/{PLAYLIST_ID}?u"
+        assert extract_playlist_id(url) == PLAYLIST_ID
+
+    def test_url_with_fragment(self) -> None:
+        """Test extracting the ID from a URL with a fragment."""
+        url: str = f"https://listen.tidal.com/playlist/{PLAYLIST_ID}#top"
+        assert extract_playlist_id(url) == PLAYLIST_ID
+
+    @pytest.mark.parametrize("suffix", ["/", "//"])
+    def test_url_with_trailing_slashes(self, suffix: str) -> None:
+        """Test extracting the ID from a URL with trailing slashes."""
+        url: str = f"https://tidal.com/browse/playlist/{PLAYLIST_ID}{suffix}"
+        assert extract_playlist_id(url) == PLAYLIST_ID
+
+    def test_url_without_playlist_raises(self) -> None:
+        """Test that a URL without a playlist ID raises ValueError."""
+        with pytest.raises(ValueError):
+            extract_playlist_id("https://tidal.com/browse/album/12345")
@@ -0,0 +1,27 @@
+"""Unit tests for token helper functions."""
+
+from datetime import datetime, timedelta, timezone
+
+from tidal_playlist_monitor.utils.token import expiry_timestamp
+
+
+class TestExpiryTimestamp:
+    """Test cases for expiry_timestamp function."""
+
+    def test_naive_datetime_is_utc(self) -> None:
+        """Test that a naive datetime is read as UTC, not local time."""
+        expiry: datetime = datetime(2024, 1, 15, 14, 50, 0)
+        assert expiry_timestamp(expiry) == 1705330200.0
+
+    def test_aware_datetime(self) -> None:
+        """Test that an aware datetime keeps its own offset."""
+        expiry: datetime = datetime(2024, 1, 15, 15, 50, 0, tzinfo=timezone(timedelta(hours=1)))
+        assert expiry_timestamp(expiry) == 1705330200.0
+
+    def test_timestamp_passes_through(self) -> None:
+        """Test that a stored timestamp is returned as a float."""
+        assert expiry_timestamp(1705330200) == 1705330200.0
+
+    def test_unknown_expiry(self) -> None:
+        """Test that a missing expiry gives None."""
+        assert expiry_timestamp(None) is None
@@ -1,47 +1,117 @@
 """Command-line interface for TIDAL Playlist Monitor."""
 
+import os
+import re
 import sys
+import time
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
+from urllib.parse import urlsplit
 
-import tidalapi
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from .config.database import DatabaseHandler
-from .config.settings import Settings
-from .models.playlist import Playlist as PlaylistModel
-from .utils.logger import setup_logger
-from .utils.platform import get_config_dir
+# Heavy modules (tidalapi, rich.table, database/settings) are imported inside
+# the commands that need them so that --help and init-config start quickly.
+if TYPE_CHECKING:
+    import tidalapi
 
+    from .config.database import DatabaseHandler
+    from .config.settings import Settings
+    from .models.playlist import Playlist as PlaylistModel
+
+# Commands are registered eagerly: each one imports its heavy dependencies in its
+# own body, so building the whole command group costs about a millisecond and a
+# lazily loaded click group would not pay for splitting the CLI into modules.
 app = typer.Typer(help="TIDAL Playlist Auto-Sync Monitor")
-console = Console()
+# Output is styled with explicit markup, so skip Rich's per-print repr highlighter
+console = Console(highlight=False)
 
+# Authenticated sessions keyed by token path: (token expiry timestamp, session)
+_session_cache: dict[Path, tuple[float, 'tidalapi.Session']] = {}
+
+# Cached sessions are reused without check_login() until this close to expiry
+_TOKEN_REFRESH_MARGIN_SEC = 300
+
+# Directories already created by this process
+_ensured_dirs: set[Path] = set()
+
+# Playlist ID in the path of a TIDAL URL, e.g. https://tidal.com/browse/playlist/<UUID>
+_PLAYLIST_URL_RE = re.compile(r'/playlist/([A-Za-z0-9-]+)')
+
+
+@lru_cache(maxsize=4)
+def _load_settings(config_path: Optional[Path]) -> 'Settings':
+    """Load settings once per resolved config path."""
+    from .config.settings import Settings
 
-def get_settings(config_path: Optional[Path] = None) -> Settings:
-    """Load settings from file or defaults."""
     return Settings.from_file_or_default(config_path)
 
 
-def get_database(settings: Settings) -> DatabaseHandler:
+@lru_cache(maxsize=4)
+def _open_database(db_path: Path) -> 'DatabaseHandler':
+    """Create one database handler per database path."""
+    from .config.database import DatabaseHandler
+
+    return DatabaseHandler(db_path)
+
+
+def get_settings(config_path: Optional[Path] = None) -> 'Settings':
+    """Load settings from file or defaults."""
+    return _load_settings(config_path.resolve() if config_path else None)
+
+
+def get_database(settings: 'Settings') -> 'DatabaseHandler':
     """Get database handler."""
-    return DatabaseHandler(settings.database.path)
+    return _open_database(settings.database.path)
 
 
-def get_tidal_session(settings: Settings) -> tidalapi.Session:
-    """Get authenticated TIDAL session."""
-    session = tidalapi.Session()
+def clear_caches() -> None:
+    """Forget cached settings and database handlers (e.g. after a config change)."""
+    _load_settings.cache_clear()
+    _open_database.cache_clear()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory (and parents) once per process."""
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+def _token_expiry(token_data: dict) -> float:
+    """Get the token expiry as a POSIX timestamp (0.0 if unknown)."""
+    from .utils.token import expiry_timestamp
+
+    return expiry_timestamp(token_data.get('expiry_time')) or 0.0
+
+
+def get_tidal_session(settings: 'Settings') -> 'tidalapi.Session':
+    """Get authenticated TIDAL session.
+
+    Sessions are cached per token path for the lifetime of the process, so
+    repeated calls skip the token file read and the check_login() round-trip
+    while the token is not about to expire.
+    """
+    import orjson
+    import tidalapi
 
-    # Try to load existing token
     token_path = settings.tidal.token_path
 
-    if token_path and token_path.exists():
+    # Reuse a cached session if its token is still comfortably valid
+    cached = _session_cache.get(token_path) if token_path else None
+    if cached and cached[0] - time.time() > _TOKEN_REFRESH_MARGIN_SEC:
+        return cached[1]
+
+    session = tidalapi.Session()
+
+    # Try to load existing token
+    if token_path:
         try:
-            # Try to load from JSON file
-            import json
-            with open(token_path, 'r') as f:
-                token_data = json.load(f)
+            # Try to load from JSON file (a missing file just means no token yet)
+            token_data = orjson.loads(token_path.read_bytes())
 
             # Load the session with token data
             session.load_oauth_session(
@@ -52,7 +122,10 @@ def get_tidal_session(settings: Settings) -> tidalapi.Session:
             )
 
             if session.check_login():
+                _session_cache[token_path] = (_token_expiry(token_data), session)
                 return session
+        except FileNotFoundError:
+            pass
         except Exception as e:
             console.print(f"[yellow]Warning: Failed to load token: {e}[/yellow]")
 
@@ -64,18 +137,22 @@ def get_tidal_session(settings: Settings) -> tidalapi.Session:
 
     # Save token manually
     if token_path:
-        token_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(token_path.parent)
+
+        from .utils.token import expiry_timestamp
 
-        import json
         token_data = {
             'token_type': session.token_type,
             'access_token': session.access_token,
             'refresh_token': session.refresh_token,
-            'expiry_time': session.expiry_time.timestamp() if hasattr(session.expiry_time, 'timestamp') else session.expiry_time
+            'expiry_time': expiry_timestamp(session.expiry_time)
         }
 
-        with open(token_path, 'w') as f:
-            json.dump(token_data, f, indent=2)
+        # Write to a temp file and rename so an interrupted save never leaves a partial token
+        tmp_path = token_path.with_suffix(token_path.suffix + '.tmp')
+        tmp_path.write_bytes(orjson.dumps(token_data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, token_path)
+        _session_cache[token_path] = (_token_expiry(token_data), session)
 
         console.print(f"\n[green]Token saved to {token_path}[/green]")
 
@@ -94,20 +171,46 @@ def extract_playlist_id(url_or_id: str) -> str:
     Raises:
         ValueError: If URL format is invalid
     """
-    if url_or_id.startswith('http'):
+    if url_or_id.startswith(('http://', 'https://')):
         # Extract ID from URL
-        # Format: https://tidal.com/browse/playlist/<UUID>
-        parts = url_or_id.rstrip('/').split('/')
-        if 'playlist' in parts:
-            idx = parts.index('playlist')
-            if idx + 1 < len(parts):
-                return parts[idx + 1]
-        raise ValueError(f"Invalid playlist URL format: {url_or_id}")
+        # Only the path is matched, so share links with a query string or
+        # fragment (e.g. ".../playlist/<uuid>?u") also work
+        match = _PLAYLIST_URL_RE.search(urlsplit(url_or_id).path)
+        if not match:
+            raise ValueError(f"Invalid playlist URL format: {url_or_id}")
+        return match.group(1)
     else:
         # Assume it's already an ID
         return url_or_id
 
 
+def _fetch_playlist_model(session: 'tidalapi.Session', playlist_id: str) -> Optional['PlaylistModel']:
+    """Fetch playlist metadata from TIDAL.
+
+    Args:
+        session: Authenticated TIDAL session
+        playlist_id: TIDAL playlist ID
+
+    Returns:
+        Playlist model ready to be stored, or None if not found
+    """
+    from .models.playlist import Playlist as PlaylistModel
+
+    tidal_playlist = session.playlist(playlist_id)
+
+    if not tidal_playlist:
+        return None
+
+    return PlaylistModel(
+        playlist_id=playlist_id,
+        name=tidal_playlist.name,
+        description=tidal_playlist.description,
+        owner=tidal_playlist.creator.name if tidal_playlist.creator else None,
+        track_count=tidal_playlist.num_tracks or 0,
+        enabled=True
+    )
+
+
 @app.command()
 def start(
     config: Optional[Path] = typer.Option(
@@ -152,6 +255,12 @@ def add_playlist(
         "--config",
         "-c",
         help="Path to configuration file"
+    ),
+    yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        help="Skip confirmations"
     )
 ):
     """Add a playlist to monitoring."""
@@ -167,7 +276,7 @@ def add_playlist(
         if existing:
             console.print(f"[yellow]Playlist '{existing.name}' is already being monitored[/yellow]")
 
-            enable = typer.confirm("Enable it?", default=True)
+            enable = yes or typer.confirm("Enable it?", default=True)
             if enable:
                 db.enable_playlist(playlist_id, True)
                 console.print("[green]Playlist enabled[/green]")
@@ -179,32 +288,21 @@ def add_playlist(
 
         # Fetch playlist metadata
         console.print(f"Fetching playlist {playlist_id}...")
-        tidal_playlist = session.playlist(playlist_id)
+        playlist = _fetch_playlist_model(session, playlist_id)
 
-        if not tidal_playlist:
+        if not playlist:
             console.print(f"[red]Error: Playlist {playlist_id} not found[/red]")
             raise typer.Exit(1)
 
-        # Get track count
-        num_tracks = tidal_playlist.num_tracks or 0
-
-        # Create playlist model
-        playlist = PlaylistModel(
-            playlist_id=playlist_id,
-            name=tidal_playlist.name,
-            description=tidal_playlist.description,
-            owner=tidal_playlist.creator.name if tidal_playlist.creator else None,
-            track_count=num_tracks,
-            enabled=True
-        )
-
         # Add to database
         db.add_playlist(playlist)
 
         console.print(f"[green]Successfully added playlist: {playlist.name}[/green]")
-        console.print(f"Tracks: {num_tracks}")
+        console.print(f"Tracks: {playlist.track_count}")
         console.print(f"Owner: {playlist.owner or 'Unknown'}")
 
+    except typer.Exit:
+        raise
     except ValueError as e:
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
@@ -213,6 +311,95 @@ def add_playlist(
         raise typer.Exit(1)
 
 
+@app.command(name="add-playlists")
+def add_playlists(
+    urls: List[str] = typer.Argument(..., help="TIDAL playlist URLs or IDs"),
+    config: Optional[Path] = typer.Option(
+        None,
+        "--config",
+        "-c",
+        help="Path to configuration file"
+    ),
+    yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        help="Skip confirmations"
+    )
+):
+    """Add several playlists to monitoring at once."""
+    settings = get_settings(config)
+    db = get_database(settings)
+
+    try:
+        # Extract playlist IDs (dropping duplicates, keeping order)
+        playlist_ids = list(dict.fromkeys(extract_playlist_id(url) for url in urls))
+
+        # Split into new and already monitored playlists using one lookup each
+        existing_ids = db.get_all_playlist_ids()
+        enabled_ids = db.get_all_playlist_ids(enabled_only=True)
+
+        new_ids = []
+        disabled_ids = []
+        for playlist_id in playlist_ids:
+            if playlist_id not in existing_ids:
+                new_ids.append(playlist_id)
+            elif playlist_id not in enabled_ids:
+                disabled_ids.append(playlist_id)
+            else:
+                console.print(f"[yellow]Playlist {playlist_id} is already being monitored[/yellow]")
+
+        # Ask once for all disabled playlists
+        if disabled_ids:
+            console.print(f"[yellow]{len(disabled_ids)} playlist(s) are monitored but disabled[/yellow]")
+
+            if yes or typer.confirm("Enable them?", default=True):
+                for playlist_id in disabled_ids:
+                    db.enable_playlist(playlist_id, True)
+                console.print(f"[green]Enabled {len(disabled_ids)} playlist(s)[/green]")
+
+        if not new_ids:
+            return
+
+        # Get TIDAL session
+        console.print("Connecting to TIDAL...")
+        session = get_tidal_session(settings)
+
+        # Fetch playlist metadata
+        playlists = []
+        for playlist_id in new_ids:
+            console.print(f"Fetching playlist {playlist_id}...")
+            try:
+                playlist = _fetch_playlist_model(session, playlist_id)
+            except Exception as e:
+                console.print(f"[red]Failed to fetch playlist {playlist_id}: {e}[/red]")
+                continue
+
+            if not playlist:
+                console.print(f"[red]Error: Playlist {playlist_id} not found[/red]")
+                continue
+
+            playlists.append(playlist)
+
+        # Add to database in one transaction
+        db.add_playlists_bulk(playlists)
+
+        for playlist in playlists:
+            console.print(f"[green]Successfully added playlist: {playlist.name}[/green]")
+
+        if len(playlists) < len(new_ids):
+            raise typer.Exit(1)
+
+    except typer.Exit:
+        raise
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    except Exception as e:
+        console.print(f"[red]Failed to add playlists: {e}[/red]")
+        raise typer.Exit(1)
+
+
 @app.command(name="remove-playlist")
 def remove_playlist(
     playlist_id: str = typer.Argument(..., help="Playlist ID to remove"),
@@ -221,6 +408,13 @@ def remove_playlist(
         "--config",
         "-c",
         help="Path to configuration file"
+    ),
+    yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        "--no-confirm",
+        help="Remove without asking for confirmation"
     )
 ):
     """Remove a playlist from monitoring."""
@@ -238,7 +432,7 @@ def remove_playlist(
         console.print(f"Playlist: {playlist.name}")
         console.print(f"Tracks: {playlist.track_count}")
 
-        confirm = typer.confirm("Remove this playlist from monitoring?", default=False)
+        confirm = yes or typer.confirm("Remove this playlist from monitoring?", default=False)
 
         if confirm:
             db.remove_playlist(playlist_id)
@@ -246,6 +440,8 @@ def remove_playlist(
         else:
             console.print("[yellow]Cancelled[/yellow]")
 
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
@@ -267,6 +463,9 @@ def list_playlists(
     )
 ):
     """List all monitored playlists."""
+    from rich.table import Table
+    from rich.text import Text
+
     settings = get_settings(config)
     db = get_database(settings)
 
@@ -286,18 +485,22 @@ def list_playlists(
         table.add_column("Last Checked")
         table.add_column("Status")
 
+        # Styled once and shared by all rows, so Rich skips markup parsing per cell
+        enabled_text = Text("Enabled", style="green")
+        disabled_text = Text("Disabled", style="red")
+
         for playlist in playlists:
             last_checked = (
-                playlist.last_checked.strftime("%Y-%m-%d %H:%M")
+                playlist.last_checked.isoformat(' ', 'minutes')
                 if playlist.last_checked
                 else "Never"
             )
 
-            status = "[green]Enabled[/green]" if playlist.enabled else "[red]Disabled[/red]"
+            status = enabled_text if playlist.enabled else disabled_text
 
             table.add_row(
-                playlist.playlist_id[:8] + "...",
-                playlist.name,
+                f"{playlist.playlist_id[:8]}...",
+                Text(playlist.name),
                 str(playlist.track_count),
                 last_checked,
                 status
@@ -325,6 +528,7 @@ def check_now(
     # Import here to avoid circular dependency
     from .core.downloader import TidalDownloader
     from .core.monitor import PlaylistMonitor
+    from .utils.logger import setup_logger
 
     settings = get_settings(config)
     db = get_database(settings)
@@ -341,7 +545,12 @@ def check_now(
         )
 
         # Create monitor
-        monitor = PlaylistMonitor(session, db, logger)
+        monitor = PlaylistMonitor(
+            session,
+            db,
+            logger,
+            max_concurrent_checks=settings.scheduler.max_concurrent_checks
+        )
 
         # Create downloader
         downloader = TidalDownloader(
@@ -352,7 +561,8 @@ def check_now(
             skip_existing=settings.download.skip_existing,
             max_retries=settings.download.max_retries,
             retry_delay=settings.download.retry_delay,
-            delay_between_downloads=settings.download.delay_between_downloads
+            delay_between_downloads=settings.download.delay_between_downloads,
+            max_concurrent_downloads=settings.download.max_concurrent_downloads
         )
 
         # Configure downloader
@@ -361,7 +571,8 @@ def check_now(
         # Check all playlists
         results = monitor.check_all_playlists()
 
-        total_new = sum(len(tracks) for tracks in results.values())
+        all_new_tracks = list(chain.from_iterable(results.values()))
+        total_new = len(all_new_tracks)
 
         if total_new == 0:
             console.print("[green]No new tracks found[/green]")
@@ -370,16 +581,13 @@ def check_now(
         console.print(f"[green]Found {total_new} new track(s)[/green]")
 
         # Download new tracks
-        all_new_tracks = [track for tracks in results.values() for track in tracks]
+        console.print(f"\nDownloading {total_new} track(s)...")
+        download_results = downloader.download_batch(all_new_tracks)
 
-        if all_new_tracks:
-            console.print(f"\nDownloading {len(all_new_tracks)} track(s)...")
-            download_results = downloader.download_batch(all_new_tracks)
-
-            console.print(
-                f"[green]Download complete: {download_results['success']} successful, "
-                f"{download_results['failed']} failed[/green]"
-            )
+        console.print(
+            f"[green]Download complete: {download_results['success']} successful, "
+            f"{download_results['failed']} failed[/green]"
+        )
 
     except Exception as e:
         console.print(f"[red]Check failed: {e}[/red]")
@@ -396,12 +604,14 @@ def status(
     )
 ):
     """Show service status and statistics."""
+    from .utils.platform import get_config_dir
+
     settings = get_settings(config)
     db = get_database(settings)
 
     try:
         # Get statistics
-        playlists = db.get_monitored_playlists(enabled_only=False)
+        playlist_counts = db.get_playlist_counts()
         download_stats = db.get_download_stats()
 
         # Display stats
@@ -412,10 +622,11 @@ def status(
         console.print(f"Log file: {settings.logging.path}\n")
 
         console.print(f"[bold]Playlists:[/bold]")
-        enabled_count = sum(1 for p in playlists if p.enabled)
-        console.print(f"  Total: {len(playlists)}")
+        enabled_count = playlist_counts[True]
+        disabled_count = playlist_counts[False]
+        console.print(f"  Total: {enabled_count + disabled_count}")
         console.print(f"  Enabled: {enabled_count}")
-        console.print(f"  Disabled: {len(playlists) - enabled_count}\n")
+        console.print(f"  Disabled: {disabled_count}\n")
 
         console.print(f"[bold]Downloads:[/bold]")
         console.print(f"  Completed: {download_stats.get('completed', 0)}")
@@ -438,6 +649,9 @@ def init_config(
     )
 ):
     """Initialize a configuration file with defaults."""
+    from .config.settings import Settings
+    from .utils.platform import get_config_dir
+
     if output is None:
         output = get_config_dir() / 'config.yaml'
 
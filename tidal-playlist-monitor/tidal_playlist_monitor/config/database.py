@@ -1,18 +1,122 @@
 """Database management for TIDAL Playlist Monitor."""
 
 import sqlite3
+import threading
+import weakref
+from collections import defaultdict
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 from ..models.download import Download, DownloadStatus
 from ..models.playlist import Playlist
 from ..models.track import Track
 
+# TIMESTAMP columns are stored as ISO 8601 text and parsed back by sqlite3 itself
+# (detect_types=PARSE_DECLTYPES), so rows arrive with datetime objects already
+sqlite3.register_adapter(datetime, datetime.isoformat)
+sqlite3.register_converter("TIMESTAMP", lambda value: datetime.fromisoformat(value.decode()))
+
+# UPDATE ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+
+# Schema version stored in PRAGMA user_version
+SCHEMA_VERSION = 2
+
+# Table definitions shared by init_database and schema migrations
+_TRACKS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        playlist_id TEXT NOT NULL,
+        track_id TEXT NOT NULL,
+        title TEXT NOT NULL,
+        artist TEXT,
+        album TEXT,
+        duration INTEGER,
+        tidal_url TEXT NOT NULL,
+        added_at TIMESTAMP,
+        discovered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (playlist_id) REFERENCES playlists(playlist_id) ON DELETE CASCADE,
+        UNIQUE(playlist_id, track_id)
+    )
+"""
+
+# downloads.track_id has no foreign key: tracks.track_id is only unique per playlist
+_DOWNLOADS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        track_id TEXT NOT NULL,
+        status TEXT NOT NULL,
+        retry_count INTEGER DEFAULT 0,
+        started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        completed_at TIMESTAMP,
+        error_message TEXT
+    )
+"""
+
+# Statements used from several places or chosen at runtime. Keeping each one a
+# single module-level string lets the connection's statement cache reuse the
+# compiled statement instead of re-preparing equivalent SQL.
+_SQL_INSERT_TRACK = """
+    INSERT OR IGNORE INTO tracks
+    (playlist_id, track_id, title, artist, album, duration, tidal_url, added_at, discovered_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_SELECT_PLAYLISTS = """
+    SELECT playlist_id, name, description, owner, last_checked, track_count, enabled, created_at,
+           last_updated
+    FROM playlists
+"""
+_SQL_SELECT_ENABLED_PLAYLISTS = _SQL_SELECT_PLAYLISTS + "WHERE enabled = 1"
+_SQL_SELECT_PLAYLIST_IDS = "SELECT playlist_id FROM playlists"
+_SQL_SELECT_ENABLED_PLAYLIST_IDS = "SELECT playlist_id FROM playlists WHERE enabled = 1"
+
+
+def _track_row(track: Track, playlist_id: str, now: datetime) -> tuple:
+    """Build the _SQL_INSERT_TRACK parameters for a track.
+
+    Args:
+        track: Track to insert
+        playlist_id: Playlist the track belongs to
+        now: Discovery time for tracks without one
+
+    Returns:
+        Tuple of statement parameters
+    """
+    return (
+        playlist_id,
+        track.track_id,
+        track.title,
+        track.artist,
+        track.album,
+        track.duration,
+        track.tidal_url,
+        track.added_at,
+        track.discovered_at or now
+    )
+
+
+# Template for get_download_stats: every status, counted as zero
+_ZERO_DOWNLOAD_STATS = dict.fromkeys((status.value for status in DownloadStatus), 0)
+
+# Room for every statement the handler uses, so none gets evicted
+_CACHED_STATEMENTS = 256
+
 
 class DatabaseHandler:
-    """SQLite database handler for playlist monitoring."""
+    """SQLite database handler for playlist monitoring.
+
+    A single connection is opened per handler and shared by all methods. The
+    scheduler runs checks in a worker thread, so access is serialized with a lock.
+
+    This is deliberate: SQLite allows only one writer at a time, and the
+    monitor issues a handful of short queries per check, so a connection pool
+    would only add contention. Opening a connection per call would throw away
+    the statement cache and connection PRAGMAs on every query. If reads ever
+    become a bottleneck, add read-only connections
+    (``file:...?mode=ro`` URIs) alongside this writer rather than replacing it.
+    """
 
     def __init__(self, db_path: Path):
         """Initialize database handler.
@@ -22,28 +126,66 @@ class DatabaseHandler:
         """
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,  # Transactions are managed in get_connection
+            cached_statements=_CACHED_STATEMENTS,
+            detect_types=sqlite3.PARSE_DECLTYPES
+        )
+        # Rows are plain tuples; only lookups that read many columns by name
+        # opt into sqlite3.Row on their own cursor
+        # Closes the connection at exit without keeping the handler alive until then
+        self._finalizer = weakref.finalize(self, self._conn.close)
+
         self.init_database()
 
     @contextmanager
-    def get_connection(self):
-        """Context manager for database connections.
+    def get_connection(self, write: bool = True):
+        """Context manager for a transaction on the shared connection.
+
+        Commits on success and rolls back on error. Nested blocks join the
+        enclosing transaction.
+
+        Args:
+            write: Whether the transaction writes. Write transactions take the
+                write lock up front (BEGIN IMMEDIATE); read-only ones are
+                deferred, so in WAL mode they never block other processes.
 
         Yields:
             sqlite3.Connection: Database connection
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        with self._lock:
+            if self._conn.in_transaction:
+                yield self._conn
+                return
+
+            # The connection's own context manager commits or rolls back the
+            # transaction opened here; it never closes the connection
+            self._conn.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+            with self._conn:
+                yield self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._finalizer()
 
     def init_database(self) -> None:
-        """Initialize database schema."""
+        """Initialize connection settings and database schema."""
+        # Only takes effect on a new database, so it must run before anything
+        # writes the file header (switching to WAL does)
+        self._conn.execute("PRAGMA page_size=8192")
+        # WAL lets readers run alongside the writer; NORMAL sync is safe in WAL mode
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA cache_size=-20000")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        # Read pages through a memory map instead of a read() call per page
+        self._conn.execute("PRAGMA mmap_size=268435456")
+
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
@@ -57,41 +199,16 @@ class DatabaseHandler:
                     last_checked TIMESTAMP,
                     track_count INTEGER DEFAULT 0,
                     enabled BOOLEAN DEFAULT 1,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_updated TIMESTAMP
                 )
             """)
 
             # Create tracks table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tracks (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    playlist_id TEXT NOT NULL,
-                    track_id TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    artist TEXT,
-                    album TEXT,
-                    duration INTEGER,
-                    tidal_url TEXT NOT NULL,
-                    added_at TIMESTAMP,
-                    discovered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (playlist_id) REFERENCES playlists(playlist_id),
-                    UNIQUE(playlist_id, track_id)
-                )
-            """)
+            cursor.execute(_TRACKS_TABLE_SQL.format(table='tracks'))
 
             # Create downloads table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS downloads (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    track_id TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    retry_count INTEGER DEFAULT 0,
-                    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    completed_at TIMESTAMP,
-                    error_message TEXT,
-                    FOREIGN KEY (track_id) REFERENCES tracks(track_id)
-                )
-            """)
+            cursor.execute(_DOWNLOADS_TABLE_SQL.format(table='downloads'))
 
             # Create config table
             cursor.execute("""
@@ -102,11 +219,72 @@ class DatabaseHandler:
                 )
             """)
 
+            # Upgrade tables created by older versions
+            self._migrate_schema(cursor)
+
             # Create indexes
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_tracks_playlist ON tracks(playlist_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_tracks_track_id ON tracks(track_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_downloads_status ON downloads(status)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_downloads_track_id ON downloads(track_id)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_downloads_status_started ON downloads(status, started_at DESC)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_downloads_track_status ON downloads(track_id, status)"
+            )
+
+            # Superseded by the composite indexes above (same leading column)
+            cursor.execute("DROP INDEX IF EXISTS idx_downloads_status")
+            cursor.execute("DROP INDEX IF EXISTS idx_downloads_track_id")
+
+        # Enabled only now, as migrations must run with foreign keys off
+        self._conn.execute("PRAGMA foreign_keys=ON")
+
+    def _migrate_schema(self, cursor: sqlite3.Cursor) -> None:
+        """Upgrade the schema to SCHEMA_VERSION.
+
+        Version 1 adds ON DELETE CASCADE to tracks.playlist_id and drops the
+        downloads.track_id foreign key, which pointed at a non-unique column.
+        Version 2 adds playlists.last_updated.
+
+        Args:
+            cursor: Cursor inside the init_database transaction
+        """
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+
+        if version < 1:
+            tracks_sql = cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'tracks'"
+            ).fetchone()[0]
+
+            if 'ON DELETE CASCADE' not in tracks_sql:
+                # Rebuild, dropping tracks left behind by removed playlists
+                cursor.execute(_TRACKS_TABLE_SQL.format(table='tracks_new'))
+                cursor.execute("""
+                    INSERT INTO tracks_new
+                    SELECT * FROM tracks
+                    WHERE playlist_id IN (SELECT playlist_id FROM playlists)
+                """)
+                cursor.execute("DROP TABLE tracks")
+                cursor.execute("ALTER TABLE tracks_new RENAME TO tracks")
+
+            downloads_sql = cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'downloads'"
+            ).fetchone()[0]
+
+            if 'REFERENCES' in downloads_sql:
+                cursor.execute(_DOWNLOADS_TABLE_SQL.format(table='downloads_new'))
+                cursor.execute("INSERT INTO downloads_new SELECT * FROM downloads")
+                cursor.execute("DROP TABLE downloads")
+                cursor.execute("ALTER TABLE downloads_new RENAME TO downloads")
+
+        if version < 2:
+            columns = {row[1] for row in cursor.execute("PRAGMA table_info(playlists)")}
+            if 'last_updated' not in columns:
+                cursor.execute("ALTER TABLE playlists ADD COLUMN last_updated TIMESTAMP")
+
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
     # Playlist methods
 
@@ -116,21 +294,34 @@ class DatabaseHandler:
         Args:
             playlist: Playlist to add
         """
+        self.add_playlists_bulk([playlist])
+
+    def add_playlists_bulk(self, playlists: List[Playlist]) -> None:
+        """Add several playlists to monitoring in a single transaction.
+
+        Args:
+            playlists: Playlists to add
+        """
+        now = datetime.now()
+
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
+            cursor.executemany("""
                 INSERT OR REPLACE INTO playlists
                 (playlist_id, name, description, owner, track_count, enabled, created_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                playlist.playlist_id,
-                playlist.name,
-                playlist.description,
-                playlist.owner,
-                playlist.track_count,
-                playlist.enabled,
-                playlist.created_at or datetime.now()
-            ))
+            """, [
+                (
+                    playlist.playlist_id,
+                    playlist.name,
+                    playlist.description,
+                    playlist.owner,
+                    playlist.track_count,
+                    playlist.enabled,
+                    playlist.created_at or now
+                )
+                for playlist in playlists
+            ])
 
     def remove_playlist(self, playlist_id: str) -> None:
         """Remove a playlist from monitoring.
@@ -140,7 +331,14 @@ class DatabaseHandler:
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            # Remove playlist (tracks will be cascade deleted by foreign key)
+            # Drop download history for tracks no other playlist still holds,
+            # otherwise failed entries would be retried for tracks that are gone
+            cursor.execute("""
+                DELETE FROM downloads
+                WHERE track_id IN (SELECT track_id FROM tracks WHERE playlist_id = ?)
+                AND track_id NOT IN (SELECT track_id FROM tracks WHERE playlist_id != ?)
+            """, (playlist_id, playlist_id))
+            # Remove playlist (tracks are cascade deleted by the foreign key)
             cursor.execute("DELETE FROM playlists WHERE playlist_id = ?", (playlist_id,))
 
     def get_monitored_playlists(self, enabled_only: bool = True) -> List[Playlist]:
@@ -152,30 +350,63 @@ class DatabaseHandler:
         Returns:
             List of Playlist objects
         """
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
+            cursor.execute(_SQL_SELECT_ENABLED_PLAYLISTS if enabled_only else _SQL_SELECT_PLAYLISTS)
 
-            query = "SELECT * FROM playlists"
-            if enabled_only:
-                query += " WHERE enabled = 1"
-
-            cursor.execute(query)
-            rows = cursor.fetchall()
-
+            # Built straight off the cursor, but materialized before the lock is
+            # released: callers update these rows while iterating the result
             return [
                 Playlist(
-                    playlist_id=row['playlist_id'],
-                    name=row['name'],
-                    description=row['description'],
-                    owner=row['owner'],
-                    last_checked=datetime.fromisoformat(row['last_checked']) if row['last_checked'] else None,
-                    track_count=row['track_count'],
-                    enabled=bool(row['enabled']),
-                    created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None
+                    playlist_id=playlist_id,
+                    name=name,
+                    description=description,
+                    owner=owner,
+                    last_checked=last_checked,
+                    track_count=track_count,
+                    enabled=bool(enabled),
+                    created_at=created_at,
+                    last_updated=last_updated
                 )
-                for row in rows
+                for (
+                    playlist_id, name, description, owner, last_checked, track_count, enabled, created_at,
+                    last_updated
+                ) in cursor
             ]
 
+    def get_all_playlist_ids(self, enabled_only: bool = False) -> FrozenSet[str]:
+        """Get the IDs of all monitored playlists.
+
+        Args:
+            enabled_only: Only return enabled playlists
+
+        Returns:
+            Frozen set of playlist IDs
+        """
+        with self.get_connection(write=False) as conn:
+            query = _SQL_SELECT_ENABLED_PLAYLIST_IDS if enabled_only else _SQL_SELECT_PLAYLIST_IDS
+            return frozenset(row[0] for row in conn.execute(query))
+
+    def get_playlist_counts(self) -> Dict[bool, int]:
+        """Get the number of enabled and disabled playlists.
+
+        Returns:
+            Dictionary mapping enabled flag to playlist count
+        """
+        with self.get_connection(write=False) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT enabled, COUNT(*) as count
+                FROM playlists
+                GROUP BY enabled
+            """)
+
+            counts = {True: 0, False: 0}
+            for enabled, count in cursor:
+                counts[bool(enabled)] += count
+
+            return counts
+
     def get_playlist(self, playlist_id: str) -> Optional[Playlist]:
         """Get a specific playlist.
 
@@ -185,8 +416,9 @@ class DatabaseHandler:
         Returns:
             Playlist object or None if not found
         """
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute("SELECT * FROM playlists WHERE playlist_id = ?", (playlist_id,))
             row = cursor.fetchone()
 
@@ -196,25 +428,32 @@ class DatabaseHandler:
                     name=row['name'],
                     description=row['description'],
                     owner=row['owner'],
-                    last_checked=datetime.fromisoformat(row['last_checked']) if row['last_checked'] else None,
+                    last_checked=row['last_checked'],
                     track_count=row['track_count'],
                     enabled=bool(row['enabled']),
-                    created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None
+                    created_at=row['created_at'],
+                    last_updated=row['last_updated']
                 )
             return None
 
-    def update_playlist_last_checked(self, playlist_id: str, timestamp: datetime) -> None:
+    def update_playlist_last_checked(
+        self,
+        playlist_id: str,
+        timestamp: datetime,
+        last_updated: Optional[datetime] = None
+    ) -> None:
         """Update playlist last checked timestamp.
 
         Args:
             playlist_id: Playlist ID
             timestamp: Last checked timestamp
+            last_updated: When TIDAL last modified the playlist, if known
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "UPDATE playlists SET last_checked = ? WHERE playlist_id = ?",
-                (timestamp.isoformat(), playlist_id)
+                "UPDATE playlists SET last_checked = ?, last_updated = ? WHERE playlist_id = ?",
+                (timestamp, last_updated, playlist_id)
             )
 
     def enable_playlist(self, playlist_id: str, enabled: bool = True) -> None:
@@ -242,13 +481,41 @@ class DatabaseHandler:
         Returns:
             Set of track IDs
         """
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT track_id FROM tracks WHERE playlist_id = ?",
                 (playlist_id,)
             )
-            return {row['track_id'] for row in cursor.fetchall()}
+            return {track_id for (track_id,) in cursor}
+
+    def get_all_playlist_track_ids(self) -> Dict[str, Set[str]]:
+        """Get the track IDs of every playlist in one query.
+
+        Returns:
+            Dictionary mapping playlist ID to its set of track IDs
+        """
+        track_ids = defaultdict(set)
+
+        with self.get_connection(write=False) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT playlist_id, track_id FROM tracks")
+            for playlist_id, track_id in cursor:
+                track_ids[playlist_id].add(track_id)
+
+        return dict(track_ids)
+
+    def get_data_version(self) -> int:
+        """Get a value that changes whenever another connection commits.
+
+        Changes made through this handler's own connection leave it unchanged,
+        so callers can tell whether data they cached was modified elsewhere.
+
+        Returns:
+            SQLite data version of the connection
+        """
+        with self.get_connection(write=False) as conn:
+            return conn.execute("PRAGMA data_version").fetchone()[0]
 
     def add_track(self, track: Track) -> None:
         """Add a track to the database.
@@ -256,57 +523,52 @@ class DatabaseHandler:
         Args:
             track: Track to add
         """
+        self.add_tracks([track])
+
+    def add_tracks(self, tracks: Iterable[Track], playlist_id: Optional[str] = None) -> None:
+        """Add tracks to the database in a single batch.
+
+        Tracks already stored for the same playlist are left untouched.
+
+        Args:
+            tracks: Tracks to add
+            playlist_id: Playlist to store the tracks under (default: each track's own)
+        """
+        now = datetime.now()
+
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR IGNORE INTO tracks
-                (playlist_id, track_id, title, artist, album, duration, tidal_url, added_at, discovered_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                track.playlist_id,
-                track.track_id,
-                track.title,
-                track.artist,
-                track.album,
-                track.duration,
-                track.tidal_url,
-                track.added_at.isoformat() if track.added_at else None,
-                track.discovered_at or datetime.now()
-            ))
+            conn.executemany(
+                _SQL_INSERT_TRACK,
+                (_track_row(track, playlist_id or track.playlist_id, now) for track in tracks)
+            )
 
-    def update_playlist_tracks(self, playlist_id: str, tracks: List[Track]) -> None:
+    def update_playlist_tracks(
+        self,
+        playlist_id: str,
+        tracks: List[Track],
+        track_count: Optional[int] = None
+    ) -> None:
         """Update all tracks for a playlist.
 
+        The inserts and the track count update run in a single transaction.
+
         Args:
             playlist_id: Playlist ID
-            tracks: List of tracks
+            tracks: List of tracks (already stored tracks are ignored)
+            track_count: Current number of tracks, defaults to len(tracks)
         """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Add all tracks
-            for track in tracks:
-                track.playlist_id = playlist_id
-                cursor.execute("""
-                    INSERT OR IGNORE INTO tracks
-                    (playlist_id, track_id, title, artist, album, duration, tidal_url, added_at, discovered_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    track.playlist_id,
-                    track.track_id,
-                    track.title,
-                    track.artist,
-                    track.album,
-                    track.duration,
-                    track.tidal_url,
-                    track.added_at.isoformat() if track.added_at else None,
-                    track.discovered_at or datetime.now()
-                ))
-
-            # Update track count
-            cursor.execute(
-                "UPDATE playlists SET track_count = ? WHERE playlist_id = ?",
-                (len(tracks), playlist_id)
+            # Add all tracks in one batch
+            self.add_tracks(tracks, playlist_id)
+
+            # Update track count, skipping the row write when it is unchanged.
+            # This is the playlist's current size; removed tracks stay in the
+            # tracks table, so it is not derived from a COUNT(*) there
+            if track_count is None:
+                track_count = len(tracks)
+            conn.execute(
+                "UPDATE playlists SET track_count = ? WHERE playlist_id = ? AND track_count IS NOT ?",
+                (track_count, playlist_id, track_count)
             )
 
     def get_track_by_id(self, track_id: str) -> Optional[Track]:
@@ -318,8 +580,9 @@ class DatabaseHandler:
         Returns:
             Track object or None if not found
         """
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute("SELECT * FROM tracks WHERE track_id = ? LIMIT 1", (track_id,))
             row = cursor.fetchone()
 
@@ -333,8 +596,8 @@ class DatabaseHandler:
                     album=row['album'],
                     duration=row['duration'],
                     tidal_url=row['tidal_url'],
-                    added_at=datetime.fromisoformat(row['added_at']) if row['added_at'] else None,
-                    discovered_at=datetime.fromisoformat(row['discovered_at']) if row['discovered_at'] else None
+                    added_at=row['added_at'],
+                    discovered_at=row['discovered_at']
                 )
             return None
 
@@ -357,6 +620,47 @@ class DatabaseHandler:
             """, (track_id, DownloadStatus.PENDING.value, datetime.now()))
             return cursor.lastrowid
 
+    def start_download(self, track_id: str) -> int:
+        """Mark a track's download as downloading, creating its record if needed.
+
+        A track has one download record until it completes: an earlier
+        unfinished attempt is reused, keeping its retry count, so retries
+        never add records. Otherwise the result is the same as
+        create_download() followed by update_download_status() with
+        DOWNLOADING, in one transaction.
+
+        Args:
+            track_id: TIDAL track ID
+
+        Returns:
+            Download ID
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            now = datetime.now()
+
+            cursor.execute("""
+                SELECT MAX(id) FROM downloads
+                WHERE track_id = ? AND status != ?
+            """, (track_id, DownloadStatus.COMPLETED.value))
+            download_id = cursor.fetchone()[0]
+
+            if download_id is None:
+                cursor.execute("""
+                    INSERT INTO downloads (track_id, status, started_at)
+                    VALUES (?, ?, ?)
+                """, (track_id, DownloadStatus.DOWNLOADING.value, now))
+                return cursor.lastrowid
+
+            # Databases from before this change may hold several unfinished
+            # records per track; they all move along with the reused one
+            cursor.execute("""
+                UPDATE downloads
+                SET status = ?, started_at = ?, error_message = NULL, completed_at = NULL
+                WHERE track_id = ? AND status != ?
+            """, (DownloadStatus.DOWNLOADING.value, now, track_id, DownloadStatus.COMPLETED.value))
+            return download_id
+
     def update_download_status(
         self,
         track_id: str,
@@ -398,6 +702,18 @@ class DatabaseHandler:
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
+
+            if _HAS_RETURNING:
+                # Drain all rows so the statement is finished before COMMIT
+                cursor.execute("""
+                    UPDATE downloads
+                    SET retry_count = retry_count + 1
+                    WHERE track_id = ?
+                    RETURNING retry_count
+                """, (track_id,))
+                rows = cursor.fetchall()
+                return rows[0][0] if rows else 0
+
             cursor.execute("""
                 UPDATE downloads
                 SET retry_count = retry_count + 1
@@ -406,7 +722,25 @@ class DatabaseHandler:
 
             cursor.execute("SELECT retry_count FROM downloads WHERE track_id = ?", (track_id,))
             row = cursor.fetchone()
-            return row['retry_count'] if row else 0
+            return row[0] if row else 0
+
+    def mark_retrying(self, track_id: str) -> None:
+        """Mark a failed download as retrying and count the retry.
+
+        Same result as increment_retry_count() followed by
+        update_download_status() with RETRYING, in one statement.
+
+        Args:
+            track_id: TIDAL track ID
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE downloads
+                SET retry_count = retry_count + 1, status = ?,
+                    error_message = NULL, completed_at = NULL
+                WHERE track_id = ? AND status != ?
+            """, (DownloadStatus.RETRYING.value, track_id, DownloadStatus.COMPLETED.value))
 
     def get_failed_downloads(self) -> List[Download]:
         """Get all failed downloads.
@@ -414,26 +748,89 @@ class DatabaseHandler:
         Returns:
             List of Download objects
         """
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT * FROM downloads
+                SELECT id, track_id, retry_count, started_at, completed_at, error_message
+                FROM downloads
                 WHERE status = ?
                 ORDER BY started_at DESC
             """, (DownloadStatus.FAILED.value,))
 
-            rows = cursor.fetchall()
+            # Materialized for the same reason as get_monitored_playlists: the
+            # retry loop changes the status this query scans the index by
             return [
                 Download(
-                    id=row['id'],
-                    track_id=row['track_id'],
-                    status=DownloadStatus(row['status']),
-                    retry_count=row['retry_count'],
-                    started_at=datetime.fromisoformat(row['started_at']) if row['started_at'] else None,
-                    completed_at=datetime.fromisoformat(row['completed_at']) if row['completed_at'] else None,
-                    error_message=row['error_message']
+                    id=download_id,
+                    track_id=track_id,
+                    status=DownloadStatus.FAILED,
+                    retry_count=retry_count,
+                    started_at=started_at,
+                    completed_at=completed_at,
+                    error_message=error_message
+                )
+                for download_id, track_id, retry_count, started_at, completed_at, error_message in cursor
+            ]
+
+    def get_failed_downloads_with_tracks(self) -> List[Tuple[Download, Track]]:
+        """Get all failed downloads together with their tracks.
+
+        Each track is returned once, with its highest retry count, even if
+        it has several failed download records. Downloads whose track is no
+        longer in the database are left out.
+
+        Returns:
+            List of (Download, Track) tuples
+        """
+        with self.get_connection(write=False) as conn:
+            cursor = conn.cursor()
+            # A track in several playlists has several rows; like
+            # get_track_by_id, take the first one. With a single MAX()
+            # aggregate, SQLite takes the other columns from the row holding
+            # the maximum.
+            cursor.execute("""
+                SELECT d.id, d.track_id, MAX(d.retry_count), d.started_at, d.completed_at,
+                       d.error_message, t.id, t.playlist_id, t.title, t.artist, t.album,
+                       t.duration, t.tidal_url, t.added_at, t.discovered_at
+                FROM downloads d
+                JOIN tracks t ON t.id = (
+                    SELECT id FROM tracks WHERE track_id = d.track_id LIMIT 1
                 )
-                for row in rows
+                WHERE d.status = ?
+                GROUP BY d.track_id
+                ORDER BY d.started_at DESC
+            """, (DownloadStatus.FAILED.value,))
+
+            # Materialized like get_failed_downloads
+            return [
+                (
+                    Download(
+                        id=download_id,
+                        track_id=track_id,
+                        status=DownloadStatus.FAILED,
+                        retry_count=retry_count,
+                        started_at=started_at,
+                        completed_at=completed_at,
+                        error_message=error_message
+                    ),
+                    Track(
+                        id=row_id,
+                        playlist_id=playlist_id,
+                        track_id=track_id,
+                        title=title,
+                        artist=artist,
+                        album=album,
+                        duration=duration,
+                        tidal_url=tidal_url,
+                        added_at=added_at,
+                        discovered_at=discovered_at
+                    )
+                )
+                for (
+                    download_id, track_id, retry_count, started_at, completed_at,
+                    error_message, row_id, playlist_id, title, artist, album,
+                    duration, tidal_url, added_at, discovered_at
+                ) in cursor
             ]
 
     def get_download_stats(self) -> Dict[str, int]:
@@ -442,7 +839,7 @@ class DatabaseHandler:
         Returns:
             Dictionary with download counts by status
         """
-        with self.get_connection() as conn:
+        with self.get_connection(write=False) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT status, COUNT(*) as count
@@ -450,8 +847,7 @@ class DatabaseHandler:
                 GROUP BY status
             """)
 
-            stats = {status.value: 0 for status in DownloadStatus}
-            for row in cursor.fetchall():
-                stats[row['status']] = row['count']
+            stats = _ZERO_DOWNLOAD_STATS.copy()
+            stats.update(cursor)
 
             return stats
@@ -1,14 +1,46 @@
 """Configuration management for TIDAL Playlist Monitor."""
 
 import logging
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 import yaml
 
 from ..utils.platform import get_config_dir, get_default_download_dir
 
+# Prefer the libyaml C implementations when PyYAML was built with them
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YamlDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+@lru_cache(maxsize=1)
+def _home() -> Path:
+    """Get the user's home directory, looked up once per process."""
+    return Path.home()
+
+
+def _to_path(value: Union[str, Path]) -> Path:
+    """Convert a configured path to a Path, expanding a leading '~'.
+
+    Args:
+        value: Path or string from the config file
+
+    Returns:
+        Path with the user's home directory expanded
+    """
+    if isinstance(value, Path):
+        return value
+    if value.startswith('~/'):
+        return _home() / value[2:]
+    return Path(value).expanduser()
+
+
+def _yaml_dict_factory(items: list) -> dict:
+    """Build a dict for YAML output, converting paths to strings."""
+    return {key: str(value) if isinstance(value, Path) else value for key, value in items}
+
 
 @dataclass
 class TidalConfig:
@@ -20,8 +52,8 @@ class TidalConfig:
         """Set default token path if not specified."""
         if self.token_path is None:
             self.token_path = get_config_dir() / 'tidal_token.json'
-        elif isinstance(self.token_path, str):
-            self.token_path = Path(self.token_path).expanduser()
+        else:
+            self.token_path = _to_path(self.token_path)
 
 
 @dataclass
@@ -34,8 +66,8 @@ class DatabaseConfig:
         """Set default database path if not specified."""
         if self.path is None:
             self.path = get_config_dir() / 'monitor.db'
-        elif isinstance(self.path, str):
-            self.path = Path(self.path).expanduser()
+        else:
+            self.path = _to_path(self.path)
 
 
 @dataclass
@@ -45,22 +77,31 @@ class SchedulerConfig:
     check_interval_minutes: int = 30
     use_cron_schedule: bool = False
     cron_schedule: str = "0 */2 * * *"
+    max_concurrent_checks: int = 3
 
     def __post_init__(self):
         """Validate configuration."""
         if self.check_interval_minutes < 5:
             raise ValueError("check_interval_minutes must be >= 5")
 
+        if not (1 <= self.max_concurrent_checks <= 10):
+            raise ValueError("max_concurrent_checks must be between 1 and 10")
+
 
 @dataclass
 class DownloadConfig:
     """Download configuration."""
 
+    # Accepted qualities, in the order shown in error messages
+    _QUALITIES = ("LOW", "HIGH", "LOSSLESS", "HI_RES")
+    _VALID_QUALITIES = frozenset(_QUALITIES)
+
     audio_quality: str = "HI_RES"
     download_path: Optional[Path] = None
     max_retries: int = 3
     retry_delay: int = 60
     delay_between_downloads: int = 5
+    max_concurrent_downloads: int = 3
     extract_flac: bool = False
     skip_existing: bool = True
 
@@ -68,13 +109,12 @@ class DownloadConfig:
         """Validate configuration and set defaults."""
         if self.download_path is None:
             self.download_path = get_default_download_dir()
-        elif isinstance(self.download_path, str):
-            self.download_path = Path(self.download_path).expanduser()
+        else:
+            self.download_path = _to_path(self.download_path)
 
         # Validate audio quality
-        valid_qualities = ["LOW", "HIGH", "LOSSLESS", "HI_RES"]
-        if self.audio_quality not in valid_qualities:
-            raise ValueError(f"audio_quality must be one of {valid_qualities}")
+        if self.audio_quality not in self._VALID_QUALITIES:
+            raise ValueError(f"audio_quality must be one of {list(self._QUALITIES)}")
 
         # Validate retry settings
         if not (0 <= self.max_retries <= 10):
@@ -86,6 +126,9 @@ class DownloadConfig:
         if self.delay_between_downloads < 1:
             raise ValueError("delay_between_downloads must be >= 1 second")
 
+        if not (1 <= self.max_concurrent_downloads <= 10):
+            raise ValueError("max_concurrent_downloads must be between 1 and 10")
+
 
 @dataclass
 class NotificationConfig:
@@ -102,6 +145,10 @@ class NotificationConfig:
 class LoggingConfig:
     """Logging configuration."""
 
+    # Accepted levels, in the order shown in error messages
+    _LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+    _VALID_LEVELS = frozenset(_LEVELS)
+
     path: Optional[Path] = None
     level: str = "INFO"
     max_size_mb: int = 10
@@ -111,13 +158,12 @@ class LoggingConfig:
         """Validate configuration and set defaults."""
         if self.path is None:
             self.path = get_config_dir() / 'service.log'
-        elif isinstance(self.path, str):
-            self.path = Path(self.path).expanduser()
+        else:
+            self.path = _to_path(self.path)
 
         # Validate log level
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.level.upper() not in valid_levels:
-            raise ValueError(f"level must be one of {valid_levels}")
+        if self.level.upper() not in self._VALID_LEVELS:
+            raise ValueError(f"level must be one of {list(self._LEVELS)}")
 
 
 @dataclass
@@ -149,7 +195,7 @@ class Settings:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
         with open(config_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YamlLoader) or {}
 
         # Create config objects with validation
         return cls(
@@ -196,42 +242,8 @@ class Settings:
 
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Convert to dict for YAML serialization
-        data = {
-            'tidal': {
-                'token_path': str(self.tidal.token_path) if self.tidal.token_path else None
-            },
-            'database': {
-                'path': str(self.database.path) if self.database.path else None
-            },
-            'scheduler': {
-                'check_interval_minutes': self.scheduler.check_interval_minutes,
-                'use_cron_schedule': self.scheduler.use_cron_schedule,
-                'cron_schedule': self.scheduler.cron_schedule
-            },
-            'download': {
-                'audio_quality': self.download.audio_quality,
-                'download_path': str(self.download.download_path) if self.download.download_path else None,
-                'max_retries': self.download.max_retries,
-                'retry_delay': self.download.retry_delay,
-                'delay_between_downloads': self.download.delay_between_downloads,
-                'extract_flac': self.download.extract_flac,
-                'skip_existing': self.download.skip_existing
-            },
-            'notifications': {
-                'enabled': self.notifications.enabled,
-                'desktop': self.notifications.desktop,
-                'on_new_tracks': self.notifications.on_new_tracks,
-                'on_download_complete': self.notifications.on_download_complete,
-                'on_error': self.notifications.on_error
-            },
-            'logging': {
-                'path': str(self.logging.path) if self.logging.path else None,
-                'level': self.logging.level,
-                'max_size_mb': self.logging.max_size_mb,
-                'backup_count': self.logging.backup_count
-            }
-        }
+        # Convert to dict for YAML serialization (paths as plain strings)
+        data = asdict(self, dict_factory=_yaml_dict_factory)
 
         with open(config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False, indent=2)
+            yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False, indent=2)
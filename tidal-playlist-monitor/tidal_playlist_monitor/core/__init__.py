@@ -1,8 +1,22 @@
 """Core functionality for TIDAL Playlist Monitor."""
 
+from typing import TYPE_CHECKING
+
 from .downloader import TidalDownloader
-from .monitor import PlaylistMonitor
 from .notifier import Notifier
 from .scheduler import PlaylistScheduler
 
+# The monitor imports tidalapi, so it is only loaded when first accessed
+if TYPE_CHECKING:
+    from .monitor import PlaylistMonitor
+
 __all__ = ["TidalDownloader", "PlaylistMonitor", "Notifier", "PlaylistScheduler"]
+
+
+def __getattr__(name: str):
+    """Import the monitor on first access."""
+    if name == "PlaylistMonitor":
+        from .monitor import PlaylistMonitor
+
+        return PlaylistMonitor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
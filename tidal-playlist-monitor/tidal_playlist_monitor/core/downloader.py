@@ -1,16 +1,30 @@
 """Download manager with Windows compatibility."""
 
 import logging
+import random
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from itertools import chain, repeat
 from pathlib import Path
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Iterable, List, Optional
 
 from ..config.database import DatabaseHandler
 from ..models.download import DownloadStatus
 from ..models.track import Track
 
+# Monitor quality setting -> tidalapi.Quality member name used by tidal-dl-ng
+_QUALITY_MAP = MappingProxyType({
+    'LOW': 'low_320k',
+    'HIGH': 'high_lossless',
+    'LOSSLESS': 'high_lossless',
+    'HI_RES': 'hi_res_lossless'
+})
+
 
 class TidalDownloader:
     """Manages downloads using tidal-dl-ng with Windows compatibility."""
@@ -25,7 +39,10 @@ class TidalDownloader:
         max_retries: int = 3,
         retry_delay: int = 60,
         delay_between_downloads: int = 5,
-        timeout: int = 600
+        max_concurrent_downloads: int = 3,
+        timeout: int = 600,
+        retry_delay_cap: int = 3600,
+        failure_threshold: int = 10
     ):
         """Initialize downloader.
 
@@ -36,9 +53,13 @@ class TidalDownloader:
             download_path: Base download directory
             skip_existing: Skip already downloaded tracks
             max_retries: Maximum retry attempts
-            retry_delay: Delay between retries in seconds
-            delay_between_downloads: Delay between sequential downloads
+            retry_delay: Base delay between retries in seconds, doubled per attempt
+            delay_between_downloads: Minimum delay between download starts
+            max_concurrent_downloads: Number of tracks downloaded at once
             timeout: Timeout per track in seconds
+            retry_delay_cap: Upper bound for the retry delay in seconds
+            failure_threshold: Consecutive failures after which retries are
+                paused for retry_delay_cap seconds
         """
         self.db = db
         self.logger = logger
@@ -48,17 +69,37 @@ class TidalDownloader:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.delay_between_downloads = delay_between_downloads
+        self.max_concurrent_downloads = max_concurrent_downloads
         self.timeout = timeout
+        self.retry_delay_cap = retry_delay_cap
+        self.failure_threshold = failure_threshold
+
+        # Consecutive failed downloads across all tracks, and when the last one failed
+        self._consecutive_failures = 0
+        self._last_failure_at = 0.0
+        self._failures_lock = threading.Lock()
+
+        # In-process tidal-dl-ng downloader, created on first use
+        self._tidal_dl = None
+        self._use_cli = False
 
-    def _get_subprocess_kwargs(self) -> dict:
+        # subprocess.run kwargs never change, so build them once per capture mode
+        self._subprocess_kwargs = {
+            capture: self._get_subprocess_kwargs(capture) for capture in (True, False)
+        }
+
+    def _get_subprocess_kwargs(self, capture: bool = True) -> dict:
         """Get subprocess kwargs with Windows compatibility.
 
+        Args:
+            capture: Capture stdout as well as stderr
+
         Returns:
             Dictionary of kwargs for subprocess.run
         """
         kwargs = {
-            'capture_output': True,
-            'text': True,
+            'stdout': subprocess.PIPE if capture else subprocess.DEVNULL,
+            'stderr': subprocess.PIPE,
             'timeout': self.timeout
         }
 
@@ -76,16 +117,18 @@ class TidalDownloader:
     def run_tidal_command(
         self,
         args: List[str],
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        capture: bool = True
     ) -> subprocess.CompletedProcess:
         """Run a tidal-dl-ng command.
 
         Args:
             args: Command arguments (e.g., ['dl', 'URL'])
             timeout: Optional timeout override
+            capture: Capture stdout; stderr is always captured
 
         Returns:
-            CompletedProcess result
+            CompletedProcess result, with output as undecoded bytes
 
         Raises:
             subprocess.TimeoutExpired: If command times out
@@ -93,9 +136,10 @@ class TidalDownloader:
         """
         cmd = ['tidal-dl-ng'] + args
 
-        kwargs = self._get_subprocess_kwargs()
+        kwargs = self._subprocess_kwargs[capture]
         if timeout:
-            kwargs['timeout'] = timeout
+            # Copy so the shared kwargs keep the default timeout
+            kwargs = {**kwargs, 'timeout': timeout}
 
         try:
             self.logger.debug(f"Running command: {' '.join(cmd)}")
@@ -110,15 +154,64 @@ class TidalDownloader:
             self.logger.error(f"Command failed: {e}")
             raise
 
+    def _get_tidal_dl(self):
+        """Get the in-process tidal-dl-ng downloader, creating it on first use.
+
+        Downloading in-process avoids starting a new interpreter and logging in
+        to TIDAL again for every track. It uses the same settings and token
+        files as the tidal-dl-ng command.
+
+        Returns:
+            tidal-dl-ng Download instance, or None to download through the CLI
+        """
+        if self._tidal_dl is not None or self._use_cli:
+            return self._tidal_dl
+
+        try:
+            from rich.progress import Progress
+            from tidal_dl_ng.config import HandlingApp, Settings as TidalDlSettings, Tidal
+            from tidal_dl_ng.download import Download as TidalDlDownload
+        except ImportError:
+            self.logger.info("tidal-dl-ng package not importable, downloading through its CLI")
+            self._use_cli = True
+            return None
+
+        tidal = Tidal(TidalDlSettings())
+        if not tidal.login_token():
+            self.logger.warning("tidal-dl-ng has no valid login, downloading through its CLI")
+            self._use_cli = True
+            return None
+
+        handling_app = HandlingApp()
+        self._tidal_dl = TidalDlDownload(
+            tidal_obj=tidal,
+            path_base=tidal.settings.data.download_base_path,
+            fn_logger=self.logger,
+            skip_existing=tidal.settings.data.skip_existing,
+            progress=Progress(disable=True),
+            event_abort=handling_app.event_abort,
+            event_run=handling_app.event_run
+        )
+
+        return self._tidal_dl
+
     def ensure_authenticated(self) -> bool:
         """Ensure tidal-dl-ng is authenticated.
 
+        When tidal-dl-ng can be used in-process, this logs in its session, which
+        later downloads reuse.
+
         Returns:
             True if authenticated, False otherwise
         """
         try:
+            # The in-process downloader only exists once its login succeeded
+            if self._get_tidal_dl() is not None:
+                self.logger.debug("tidal-dl-ng is authenticated")
+                return True
+
             # Try to run a simple command to check authentication
-            result = self.run_tidal_command(['cfg', 'quality_audio'], timeout=10)
+            result = self.run_tidal_command(['cfg', 'quality_audio'], timeout=10, capture=False)
 
             if result.returncode == 0:
                 self.logger.debug("tidal-dl-ng is authenticated")
@@ -134,53 +227,61 @@ class TidalDownloader:
     def configure_quality(self) -> None:
         """Configure download quality in tidal-dl-ng."""
         try:
+            import tidalapi
+
             self.logger.info(f"Setting download quality to {self.quality}")
 
-            # Map quality to tidal-dl-ng format
-            quality_map = {
-                'LOW': 'low_320k',
-                'HIGH': 'high_lossless',
-                'LOSSLESS': 'high_lossless',
-                'HI_RES': 'hi_res'
+            options = {
+                'quality_audio': tidalapi.Quality[_QUALITY_MAP.get(self.quality, 'hi_res_lossless')]
             }
 
-            tidal_quality = quality_map.get(self.quality, 'hi_res')
-
-            # Set quality
-            result = self.run_tidal_command(['cfg', 'quality_audio', tidal_quality], timeout=10)
-
-            if result.returncode != 0:
-                self.logger.warning(f"Failed to set quality: {result.stderr}")
-
             # Disable FLAC extraction on Windows to avoid terminal flash
             if sys.platform == 'win32':
                 self.logger.debug("Disabling FLAC extraction on Windows")
-                result = self.run_tidal_command(['cfg', 'extract_flac', 'false'], timeout=10)
-
-                if result.returncode != 0:
-                    self.logger.warning(f"Failed to disable FLAC extraction: {result.stderr}")
+                options['extract_flac'] = False
 
             # Set download path if specified
             if self.download_path:
                 self.logger.debug(f"Setting download path to {self.download_path}")
-                result = self.run_tidal_command(
-                    ['cfg', 'download_base_path', str(self.download_path)],
-                    timeout=10
-                )
+                options['download_base_path'] = str(self.download_path)
 
-                if result.returncode != 0:
-                    self.logger.warning(f"Failed to set download path: {result.stderr}")
+            options['skip_existing'] = self.skip_existing
 
-            # Set skip existing
-            skip_value = 'true' if self.skip_existing else 'false'
-            result = self.run_tidal_command(['cfg', 'skip_existing', skip_value], timeout=10)
+            try:
+                from tidal_dl_ng.config import Settings as TidalDlSettings
+            except ImportError:
+                self._configure_with_cli(options)
+                return
 
-            if result.returncode != 0:
-                self.logger.warning(f"Failed to set skip_existing: {result.stderr}")
+            # Update the shared settings object and write the file once
+            settings = TidalDlSettings()
+            settings_old = settings.data.to_json()
+            for key, value in options.items():
+                setattr(settings.data, key, value)
+            settings.save(settings_old)
 
         except Exception as e:
             self.logger.error(f"Failed to configure tidal-dl-ng: {e}")
 
+    def _configure_with_cli(self, options: dict) -> None:
+        """Apply tidal-dl-ng settings through its cfg command.
+
+        Args:
+            options: Setting names mapped to their new values
+        """
+        for key, value in options.items():
+            if isinstance(value, bool):
+                value = 'true' if value else 'false'
+            elif isinstance(value, Enum):
+                value = value.value
+
+            result = self.run_tidal_command(['cfg', key, str(value)], timeout=10, capture=False)
+
+            if result.returncode != 0:
+                self.logger.warning(
+                    f"Failed to set {key}: {result.stderr.decode(errors='replace')}"
+                )
+
     def download_track(
         self,
         track: Track,
@@ -201,18 +302,35 @@ class TidalDownloader:
             )
 
             # Create download record
-            self.db.create_download(track.track_id)
-            self.db.update_download_status(track.track_id, DownloadStatus.DOWNLOADING)
+            self.db.start_download(track.track_id)
 
             # Run download
-            result = self.run_tidal_command(['dl', track.tidal_url])
+            tidal_dl = self._get_tidal_dl()
+            if tidal_dl is not None:
+                from tidal_dl_ng.constants import MediaType
+
+                data = tidal_dl.settings.data
+                success, _ = tidal_dl.item(
+                    file_template=data.format_track,
+                    media_id=track.track_id,
+                    media_type=MediaType.TRACK,
+                    quality_audio=data.quality_audio,
+                    quality_video=data.quality_video
+                )
+                error_msg = "Track not available or download failed"
+            else:
+                result = self.run_tidal_command(['dl', track.tidal_url])
+                success = result.returncode == 0
+                # Output is only decoded when it is reported
+                if not success:
+                    output = result.stderr or result.stdout
+                    error_msg = output.decode(errors='replace') if output else "Unknown error"
 
-            if result.returncode == 0:
+            if success:
                 self.logger.info(f"Successfully downloaded: {track.title}")
                 self.db.update_download_status(track.track_id, DownloadStatus.COMPLETED)
                 return True
             else:
-                error_msg = result.stderr or result.stdout or "Unknown error"
                 self.logger.error(f"Download failed for {track.title}: {error_msg}")
                 self.db.update_download_status(
                     track.track_id,
@@ -237,39 +355,97 @@ class TidalDownloader:
             )
             return False
 
+    def _download_all(
+        self,
+        tracks: Iterable[Track],
+        delays: Iterable[float],
+        backoffs: Optional[Iterable[float]] = None
+    ) -> dict[str, int]:
+        """Download tracks on a worker pool, spacing out download starts.
+
+        Tracks are handed to the pool as they are produced, so downloads start
+        while a lazy iterable is still yielding tracks.
+
+        Args:
+            tracks: Tracks to download
+            delays: Delay before each download starts, counted from the
+                previous start (in seconds)
+            backoffs: Optional delay before each track is queued for its
+                start (in seconds); workers wait out their backoffs at the
+                same time
+
+        Returns:
+            Dictionary with success/failure counts
+        """
+        # Create the shared tidal-dl-ng downloader before the workers need it
+        self._get_tidal_dl()
+
+        start_lock = threading.Lock()
+        last_start = time.monotonic()
+
+        def download(track: Track, delay: float, backoff: float) -> bool:
+            nonlocal last_start
+
+            if backoff > 0:
+                self.logger.debug(f"Backing off {backoff:.0f}s before retrying {track.title}...")
+                time.sleep(backoff)
+
+            # Starts are rate limited globally, however many workers are free.
+            # Only the start time is reserved under the lock; the wait for it
+            # happens outside, so other workers are not held up.
+            with start_lock:
+                start_at = max(time.monotonic(), last_start + delay)
+                last_start = start_at
+
+            wait = start_at - time.monotonic()
+            if wait > 0:
+                self.logger.debug(f"Waiting {wait:.0f}s before next download...")
+                time.sleep(wait)
+
+            success = self.download_track(track)
+
+            with self._failures_lock:
+                if success:
+                    self._consecutive_failures = 0
+                else:
+                    self._consecutive_failures += 1
+                    self._last_failure_at = time.monotonic()
+
+            return success
+
+        # The pool only starts threads as work arrives, up to the limit
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_downloads) as executor:
+            results = list(executor.map(
+                download, tracks, delays, backoffs if backoffs is not None else repeat(0.0)
+            ))
+
+        success = sum(results)
+        return {'success': success, 'failed': len(results) - success}
+
     def download_batch(
         self,
-        tracks: List[Track],
+        tracks: Iterable[Track],
         delay_between: Optional[int] = None
     ) -> dict[str, int]:
-        """Download multiple tracks with delays.
+        """Download multiple tracks concurrently, with delays between starts.
 
         Args:
-            tracks: List of tracks to download
+            tracks: Tracks to download. May be a lazy iterable; downloads
+                start as soon as its first tracks are available.
             delay_between: Optional delay override (in seconds)
 
         Returns:
             Dictionary with success/failure counts
         """
-        if not tracks:
+        # Wait for the first track before logging in and starting workers
+        tracks = iter(tracks)
+        first = next(tracks, None)
+        if first is None:
             return {'success': 0, 'failed': 0}
 
         delay = delay_between if delay_between is not None else self.delay_between_downloads
 
-        results = {'success': 0, 'failed': 0}
-
-        for i, track in enumerate(tracks):
-            success = self.download_track(track)
-
-            if success:
-                results['success'] += 1
-            else:
-                results['failed'] += 1
-
-            # Add delay between downloads (except after last track)
-            if i < len(tracks) - 1 and delay > 0:
-                self.logger.debug(f"Waiting {delay}s before next download...")
-                time.sleep(delay)
+        results = self._download_all(chain([first], tracks), chain([0], repeat(delay)))
 
         self.logger.info(
             f"Batch download complete: {results['success']} successful, "
@@ -278,23 +454,49 @@ class TidalDownloader:
 
         return results
 
+    def _retry_backoff(self, retry_count: int) -> float:
+        """Get the delay before a retry, using exponential backoff with jitter.
+
+        Args:
+            retry_count: Number of retries already made for the track
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.retry_delay_cap, self.retry_delay * 2 ** retry_count)
+        # Jitter spreads out retries of tracks that failed at the same time
+        return delay * random.uniform(0.5, 1.5)
+
     def retry_failed_downloads(self) -> dict[str, int]:
         """Retry failed downloads.
 
         Returns:
             Dictionary with retry statistics
         """
-        failed_downloads = self.db.get_failed_downloads()
+        failed_downloads = self.db.get_failed_downloads_with_tracks()
 
         if not failed_downloads:
             self.logger.info("No failed downloads to retry")
             return {'retried': 0, 'success': 0, 'failed': 0}
 
+        # Circuit breaker: while everything keeps failing (e.g. TIDAL is down),
+        # leave the retries to a later run instead of adding to the load
+        if (
+            self._consecutive_failures >= self.failure_threshold
+            and time.monotonic() - self._last_failure_at < self.retry_delay_cap
+        ):
+            self.logger.warning(
+                f"{self._consecutive_failures} consecutive download failures, pausing retries"
+            )
+            return {'retried': 0, 'success': 0, 'failed': 0}
+
         self.logger.info(f"Retrying {len(failed_downloads)} failed download(s)")
 
         stats = {'retried': 0, 'success': 0, 'failed': 0}
+        retry_tracks = []
+        retry_backoffs = []
 
-        for download in failed_downloads:
+        for download, track in failed_downloads:
             # Check if max retries exceeded
             if download.retry_count >= self.max_retries:
                 self.logger.warning(
@@ -302,30 +504,20 @@ class TidalDownloader:
                 )
                 continue
 
-            # Increment retry count
-            self.db.increment_retry_count(download.track_id)
-            self.db.update_download_status(download.track_id, DownloadStatus.RETRYING)
+            # Increment retry count and mark as retrying
+            self.db.mark_retrying(download.track_id)
 
             stats['retried'] += 1
 
-            # Wait before retry
-            if self.retry_delay > 0:
-                self.logger.debug(f"Waiting {self.retry_delay}s before retry...")
-                time.sleep(self.retry_delay)
+            retry_tracks.append(track)
+            retry_backoffs.append(self._retry_backoff(download.retry_count))
 
-            # Get track info
-            track = self.db.get_track_by_id(download.track_id)
-            if not track:
-                self.logger.error(f"Track {download.track_id} not found in database")
-                continue
-
-            # Retry download
-            success = self.download_track(track, retry_count=download.retry_count + 1)
-
-            if success:
-                stats['success'] += 1
-            else:
-                stats['failed'] += 1
+        if retry_tracks:
+            # Each retry waits out its own backoff; starts are only spaced
+            # as much as the backoffs already spread them
+            results = self._download_all(retry_tracks, repeat(0.0), retry_backoffs)
+            stats['success'] = results['success']
+            stats['failed'] = results['failed']
 
         self.logger.info(
             f"Retry complete: {stats['success']} successful, {stats['failed']} failed"
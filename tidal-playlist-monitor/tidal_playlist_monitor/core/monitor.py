@@ -1,14 +1,20 @@
 """Playlist monitoring and change detection."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Set
+from typing import AbstractSet, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
 import tidalapi
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
 from ..config.database import DatabaseHandler
+from ..models.playlist import Playlist
 from ..models.track import Track
 
+# Concurrent page requests per playlist, kept low to stay within TIDAL's rate limits
+_PAGE_FETCH_WORKERS = 4
+
 
 class PlaylistMonitor:
     """Monitors TIDAL playlists for changes."""
@@ -17,7 +23,8 @@ class PlaylistMonitor:
         self,
         session: tidalapi.Session,
         db: DatabaseHandler,
-        logger: logging.Logger
+        logger: logging.Logger,
+        max_concurrent_checks: int = 3
     ):
         """Initialize playlist monitor.
 
@@ -25,10 +32,23 @@ class PlaylistMonitor:
             session: TIDAL API session
             db: Database handler
             logger: Logger instance
+            max_concurrent_checks: Number of playlists checked at once
         """
         self.session = session
         self.db = db
         self.logger = logger
+        self.max_concurrent_checks = max_concurrent_checks
+
+        # requests keeps at most 10 connections per host by default, which can
+        # be fewer than concurrent checks use; extra ones would be dropped after
+        # use and later requests would pay for a new TLS handshake
+        pool_size = max(DEFAULT_POOLSIZE, max_concurrent_checks * _PAGE_FETCH_WORKERS)
+        session.request_session.mount('https://', HTTPAdapter(pool_maxsize=pool_size))
+
+        # Stored track IDs per playlist, kept in step with this monitor's own
+        # writes and reloaded when another process changes the database
+        self._stored_cache: Dict[str, FrozenSet[str]] = {}
+        self._cache_data_version: Optional[int] = None
 
     def get_playlist(self, playlist_id: str) -> tidalapi.Playlist:
         """Get playlist from TIDAL.
@@ -51,66 +71,134 @@ class PlaylistMonitor:
             self.logger.error(f"Failed to fetch playlist {playlist_id}: {e}")
             raise
 
-    def get_playlist_tracks(self, playlist: tidalapi.Playlist) -> List[Track]:
-        """Get all tracks from a playlist.
+    def iter_playlist_track_summaries(
+        self,
+        playlist: tidalapi.Playlist
+    ) -> Iterator[Tuple[str, tidalapi.Track]]:
+        """Iterate over the tracks of a playlist without building Track objects.
 
         Args:
             playlist: TIDAL playlist object
 
-        Returns:
-            List of Track objects
+        Yields:
+            Tuples of (track ID, TIDAL track)
         """
-        tracks = []
-
         try:
-            # Iterate through all tracks (handles pagination automatically)
-            for tidal_track in playlist.tracks():
-                # Skip if not a track (could be video)
-                if not isinstance(tidal_track, tidalapi.Track):
-                    continue
-
-                # Extract track metadata
-                track = Track(
-                    track_id=str(tidal_track.id),
-                    title=tidal_track.name,
-                    artist=tidal_track.artist.name if tidal_track.artist else None,
-                    album=tidal_track.album.name if tidal_track.album else None,
-                    duration=tidal_track.duration,
-                    tidal_url=f"https://tidal.com/browse/track/{tidal_track.id}",
-                    added_at=getattr(tidal_track, 'user_date_added', None),
-                    discovered_at=datetime.now()
-                )
-                tracks.append(track)
+            for page in self._fetch_track_pages(playlist):
+                for tidal_track in page:
+                    # Skip if not a track (could be video)
+                    if not isinstance(tidal_track, tidalapi.Track):
+                        continue
+
+                    yield str(tidal_track.id), tidal_track
 
         except Exception as e:
             self.logger.error(f"Error fetching tracks from playlist {playlist.id}: {e}")
             raise
 
-        return tracks
+    def _fetch_track_pages(self, playlist: tidalapi.Playlist) -> Iterator[list]:
+        """Fetch all pages of a playlist's tracks, in order.
+
+        A single tracks() call returns at most one page (the session's
+        item limit), so longer playlists are fetched page by page, with the
+        remaining pages requested concurrently.
+
+        Args:
+            playlist: TIDAL playlist object
+
+        Yields:
+            Lists of TIDAL tracks, one per page
+        """
+        first_page = playlist.tracks(limit=self.session.config.item_limit, offset=0)
+        yield first_page
+
+        # TIDAL may return fewer items than requested; stepping by the
+        # requested limit would then skip the tracks in between
+        page_size = len(first_page)
+        total = (playlist.num_tracks or 0) + (playlist.num_videos or 0)
+        offsets = range(page_size, total, page_size) if page_size else range(0)
+        if not offsets:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(_PAGE_FETCH_WORKERS, len(offsets))) as executor:
+            yield from executor.map(
+                lambda offset: playlist.tracks(limit=page_size, offset=offset),
+                offsets
+            )
+
+    def build_track(
+        self,
+        tidal_track: tidalapi.Track,
+        discovered_at: Optional[datetime] = None
+    ) -> Track:
+        """Build a Track from a TIDAL track.
+
+        Args:
+            tidal_track: TIDAL track object
+            discovered_at: Discovery time, defaults to now
+
+        Returns:
+            Track object
+        """
+        return Track(
+            track_id=str(tidal_track.id),
+            title=tidal_track.name,
+            artist=tidal_track.artist.name if tidal_track.artist else None,
+            album=tidal_track.album.name if tidal_track.album else None,
+            duration=tidal_track.duration,
+            tidal_url=f"https://tidal.com/browse/track/{tidal_track.id}",
+            added_at=getattr(tidal_track, 'user_date_added', None),
+            discovered_at=discovered_at or datetime.now()
+        )
+
+    def get_playlist_tracks(self, playlist: tidalapi.Playlist) -> List[Track]:
+        """Get all tracks from a playlist.
+
+        Args:
+            playlist: TIDAL playlist object
+
+        Returns:
+            List of Track objects
+        """
+        # All tracks from one fetch share the same discovery time
+        discovered_at = datetime.now()
+
+        return [
+            self.build_track(tidal_track, discovered_at)
+            for _, tidal_track in self.iter_playlist_track_summaries(playlist)
+        ]
 
     def detect_new_tracks(
         self,
         playlist_id: str,
-        current_tracks: List[Track]
+        current_tracks: List[Tuple[str, tidalapi.Track]],
+        stored_track_ids: Optional[AbstractSet[str]] = None,
+        discovered_at: Optional[datetime] = None
     ) -> List[Track]:
         """Detect new tracks by comparing with stored tracks.
 
+        Track objects are only built for the tracks that are new.
+
         Args:
             playlist_id: Playlist ID
-            current_tracks: Current tracks from TIDAL
+            current_tracks: Current (track ID, TIDAL track) pairs from TIDAL
+            stored_track_ids: Stored track IDs, queried from the database if omitted
+            discovered_at: Discovery time of the new tracks, defaults to now
 
         Returns:
             List of new Track objects
         """
         # Get stored track IDs from database
-        stored_track_ids = self.db.get_playlist_track_ids(playlist_id)
+        if stored_track_ids is None:
+            stored_track_ids = self.db.get_playlist_track_ids(playlist_id)
 
-        # Find new tracks
-        current_track_ids = {track.track_id for track in current_tracks}
-        new_track_ids = current_track_ids - stored_track_ids
-
-        # Filter to get new Track objects
-        new_tracks = [track for track in current_tracks if track.track_id in new_track_ids]
+        # Build Track objects for the new tracks only, all discovered at once
+        discovered_at = discovered_at or datetime.now()
+        new_tracks = [
+            self.build_track(tidal_track, discovered_at)
+            for track_id, tidal_track in current_tracks
+            if track_id not in stored_track_ids
+        ]
 
         if new_tracks:
             self.logger.info(
@@ -124,23 +212,41 @@ class PlaylistMonitor:
     def update_playlist_state(
         self,
         playlist_id: str,
-        tracks: List[Track]
+        tracks: List[Track],
+        track_count: Optional[int] = None,
+        checked_at: Optional[datetime] = None,
+        last_updated: Optional[datetime] = None
     ) -> None:
         """Update the stored state of a playlist.
 
         Args:
             playlist_id: Playlist ID
-            tracks: Current tracks
+            tracks: Tracks to store (already stored tracks are ignored)
+            track_count: Current number of tracks, defaults to len(tracks)
+            checked_at: Time of the check, defaults to now
+            last_updated: When TIDAL last modified the playlist, if known
         """
         try:
-            self.db.update_playlist_tracks(playlist_id, tracks)
-            self.db.update_playlist_last_checked(playlist_id, datetime.now())
+            self.db.update_playlist_tracks(playlist_id, tracks, track_count)
+            if tracks:
+                self._stored_cache[playlist_id] = self._stored_cache.get(
+                    playlist_id, frozenset()
+                ).union(track.track_id for track in tracks)
+            self.db.update_playlist_last_checked(
+                playlist_id, checked_at or datetime.now(), last_updated
+            )
             self.logger.debug(f"Updated state for playlist {playlist_id}")
         except Exception as e:
             self.logger.error(f"Failed to update playlist state: {e}")
             raise
 
-    def check_playlist(self, playlist_id: str) -> List[Track]:
+    def check_playlist(
+        self,
+        playlist_id: str,
+        stored_track_ids: Optional[AbstractSet[str]] = None,
+        checked_at: Optional[datetime] = None,
+        last_updated: Optional[datetime] = None
+    ) -> List[Track]:
         """Check a playlist for new tracks.
 
         This is the main method that orchestrates the monitoring process:
@@ -151,6 +257,11 @@ class PlaylistMonitor:
 
         Args:
             playlist_id: Playlist ID to check
+            stored_track_ids: Stored track IDs, queried from the database if omitted
+            checked_at: Time of the check, defaults to now. New tracks use it
+                as their discovery time.
+            last_updated: Modification time stored by the previous check. If
+                TIDAL reports the same time, the tracks are not fetched.
 
         Returns:
             List of new tracks found (empty if none)
@@ -158,21 +269,33 @@ class PlaylistMonitor:
         Raises:
             Exception: If check fails
         """
+        checked_at = checked_at or datetime.now()
+
         try:
             self.logger.info(f"Checking playlist {playlist_id} for changes...")
 
             # Get playlist from TIDAL
             playlist = self.get_playlist(playlist_id)
 
+            # Unchanged on TIDAL since the previous check: skip fetching tracks
+            if last_updated is not None and playlist.last_updated == last_updated:
+                self.logger.debug(f"Playlist {playlist_id} unchanged since last check")
+                self.db.update_playlist_last_checked(playlist_id, checked_at, last_updated)
+                return []
+
             # Get all current tracks
-            current_tracks = self.get_playlist_tracks(playlist)
+            current_tracks = list(self.iter_playlist_track_summaries(playlist))
             self.logger.debug(f"Fetched {len(current_tracks)} tracks from TIDAL")
 
             # Detect new tracks
-            new_tracks = self.detect_new_tracks(playlist_id, current_tracks)
+            new_tracks = self.detect_new_tracks(
+                playlist_id, current_tracks, stored_track_ids, checked_at
+            )
 
-            # Update stored state
-            self.update_playlist_state(playlist_id, current_tracks)
+            # Update stored state; existing tracks are already in the database
+            self.update_playlist_state(
+                playlist_id, new_tracks, len(current_tracks), checked_at, playlist.last_updated
+            )
 
             return new_tracks
 
@@ -187,20 +310,58 @@ class PlaylistMonitor:
         Returns:
             Dictionary mapping playlist_id to list of new tracks
         """
-        results = {}
+        return {
+            playlist.playlist_id: new_tracks
+            for playlist, new_tracks in self.iter_check_results()
+        }
+
+    def iter_check_results(self) -> Iterator[Tuple[Playlist, List[Track]]]:
+        """Check all monitored playlists, yielding each result once it is ready.
+
+        Lets callers act on a playlist's new tracks while other playlists are
+        still being checked.
+
+        Yields:
+            (playlist, new tracks) pairs, in the order the checks finish
+        """
         playlists = self.db.get_monitored_playlists(enabled_only=True)
 
         self.logger.info(f"Checking {len(playlists)} playlist(s) for changes")
 
-        for playlist in playlists:
+        if not playlists:
+            return
+
+        # Stored tracks only need reloading, in one query for every playlist,
+        # when the database was changed outside this monitor
+        data_version = self.db.get_data_version()
+        if data_version != self._cache_data_version:
+            self._stored_cache = {
+                playlist_id: frozenset(track_ids)
+                for playlist_id, track_ids in self.db.get_all_playlist_track_ids().items()
+            }
+            self._cache_data_version = data_version
+
+        # Every playlist in this sweep is stamped with the time the sweep started
+        checked_at = datetime.now()
+
+        def check(playlist: Playlist) -> List[Track]:
             try:
-                new_tracks = self.check_playlist(playlist.playlist_id)
-                results[playlist.playlist_id] = new_tracks
+                return self.check_playlist(
+                    playlist.playlist_id,
+                    self._stored_cache.get(playlist.playlist_id, frozenset()),
+                    checked_at,
+                    playlist.last_updated
+                )
             except Exception as e:
                 self.logger.error(
                     f"Failed to check playlist {playlist.playlist_id} ({playlist.name}): {e}"
                 )
-                results[playlist.playlist_id] = []
                 # Continue checking other playlists
-
-        return results
+                return []
+
+        # Playlists are checked concurrently; the pool size bounds TIDAL API load
+        workers = min(self.max_concurrent_checks, len(playlists))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(check, playlist): playlist for playlist in playlists}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
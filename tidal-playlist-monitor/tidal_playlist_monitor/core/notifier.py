@@ -2,7 +2,7 @@
 
 import logging
 import sys
-from typing import Optional
+from typing import List, Optional, Tuple
 
 try:
     from plyer import notification as plyer_notification
@@ -48,6 +48,13 @@ class Notifier:
             self.logger.warning("No notification backend available, notifications disabled")
             self.enabled = False
 
+        # Resolve the backend's send method once instead of on every notification
+        if self.backend == 'winotify':
+            self._send_backend = self._send_winotify
+        elif self.backend == 'plyer':
+            self._plyer_notify = plyer_notification.notify
+            self._send_backend = self._send_plyer
+
     def _detect_backend(self) -> Optional[str]:
         """Detect available notification backend.
 
@@ -84,23 +91,19 @@ class Notifier:
             return False
 
         try:
-            if self.backend == 'winotify':
-                return self._send_winotify(title, message)
-            elif self.backend == 'plyer':
-                return self._send_plyer(title, message, duration)
-            else:
-                return False
+            return self._send_backend(title, message, duration)
 
         except Exception as e:
             self.logger.error(f"Failed to send notification: {e}")
             return False
 
-    def _send_winotify(self, title: str, message: str) -> bool:
+    def _send_winotify(self, title: str, message: str, duration: int) -> bool:
         """Send notification using winotify (Windows 10/11).
 
         Args:
             title: Notification title
             message: Notification message
+            duration: Ignored, toasts always use the short duration
 
         Returns:
             True if successful
@@ -137,7 +140,7 @@ class Notifier:
             True if successful
         """
         try:
-            plyer_notification.notify(
+            self._plyer_notify(
                 title=title,
                 message=message,
                 app_name=self.app_name,
@@ -160,9 +163,33 @@ class Notifier:
         Returns:
             True if notification sent
         """
+        return self.notify_new_tracks_batch([(playlist_name, count)])
+
+    def notify_new_tracks_batch(self, counts: List[Tuple[str, int]]) -> bool:
+        """Notify about new tracks found in one or more playlists at once.
+
+        Args:
+            counts: (playlist name, number of new tracks) for each playlist
+
+        Returns:
+            True if notification sent
+        """
+        if not counts:
+            return False
+
+        if len(counts) == 1:
+            playlist_name, count = counts[0]
+            message = f"Found {count} new track(s) in '{playlist_name}'"
+        else:
+            total = sum(count for _, count in counts)
+            message = "\n".join(
+                [f"Found {total} new track(s) in {len(counts)} playlists"]
+                + [f"'{playlist_name}': {count}" for playlist_name, count in counts]
+            )
+
         return self.send(
             title="New Tracks Found",
-            message=f"Found {count} new track(s) in '{playlist_name}'"
+            message=message
         )
 
     def notify_download_complete(
@@ -1,15 +1,18 @@
 """Scheduler for periodic playlist checks."""
 
 import logging
+import threading
+import time
+from datetime import datetime, timedelta
 from typing import Callable, Optional
 
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
-from apscheduler.triggers.interval import IntervalTrigger
-
 
 class PlaylistScheduler:
-    """Manages scheduled playlist checks."""
+    """Manages scheduled playlist checks.
+
+    Checks run one at a time on a single worker thread, which sleeps until the
+    next check is due or an immediate check is requested.
+    """
 
     def __init__(
         self,
@@ -34,48 +37,103 @@ class PlaylistScheduler:
         self.use_cron = use_cron
         self.cron_schedule = cron_schedule
 
-        self.scheduler = BackgroundScheduler()
-        self._job_id = "playlist_check"
+        self._thread: Optional[threading.Thread] = None
+        self._cron_trigger = None
+        # time.monotonic() value at which the next scheduled check is due
+        self._next_fire = 0.0
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._run_now = False
 
     def start(self) -> None:
         """Start the scheduler."""
         try:
-            # Add the job
             if self.use_cron:
-                trigger = CronTrigger.from_crontab(self.cron_schedule)
+                # Only cron parsing needs APScheduler
+                from apscheduler.triggers.cron import CronTrigger
+
+                self._cron_trigger = CronTrigger.from_crontab(self.cron_schedule)
                 self.logger.info(f"Starting scheduler with cron schedule: {self.cron_schedule}")
             else:
-                trigger = IntervalTrigger(minutes=self.check_interval_minutes)
                 self.logger.info(
                     f"Starting scheduler with interval: {self.check_interval_minutes} minutes"
                 )
 
-            self.scheduler.add_job(
-                self._safe_check_function,
-                trigger=trigger,
-                id=self._job_id,
-                name="Playlist Check",
-                replace_existing=True
-            )
+            self._stopping.clear()
+            self._next_fire = time.monotonic()
+            self._schedule_next()
 
-            # Start the scheduler
-            self.scheduler.start()
+            self._thread = threading.Thread(
+                target=self._run,
+                name="PlaylistScheduler",
+                daemon=True
+            )
+            self._thread.start()
             self.logger.info("Scheduler started successfully")
 
         except Exception as e:
             self.logger.error(f"Failed to start scheduler: {e}")
             raise
 
-    def stop(self) -> None:
-        """Stop the scheduler gracefully."""
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the scheduler gracefully.
+
+        A check that is already running, including its downloads, is allowed
+        to finish first.
+
+        Args:
+            timeout: Maximum seconds to wait for a running check (None waits
+                until it finishes)
+        """
         try:
-            if self.scheduler.running:
+            if self.is_running():
                 self.logger.info("Stopping scheduler...")
-                self.scheduler.shutdown(wait=True)
-                self.logger.info("Scheduler stopped")
+                self._stopping.set()
+                self._wake.set()
+                # Let a running check finish
+                self._thread.join(timeout)
+                if self._thread.is_alive():
+                    # The thread is a daemon, so the check ends with the process
+                    self.logger.warning(
+                        f"Check still running after {timeout}s, not waiting for it"
+                    )
+                else:
+                    self.logger.info("Scheduler stopped")
         except Exception as e:
             self.logger.error(f"Error stopping scheduler: {e}")
 
+    def _schedule_next(self) -> None:
+        """Compute when the next scheduled check is due."""
+        now = time.monotonic()
+
+        if self._cron_trigger is not None:
+            wall_now = datetime.now().astimezone()
+            fire_time = self._cron_trigger.get_next_fire_time(None, wall_now)
+            self._next_fire = now + (fire_time - wall_now).total_seconds()
+        else:
+            # Runs missed while a check was still going are skipped, not queued
+            interval = self.check_interval_minutes * 60
+            self._next_fire += interval
+            while self._next_fire <= now:
+                self._next_fire += interval
+
+    def _run(self) -> None:
+        """Worker loop that runs checks when they are due."""
+        while not self._stopping.is_set():
+            timeout = max(0.0, self._next_fire - time.monotonic())
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+            if self._stopping.is_set():
+                break
+
+            if self._run_now:
+                self._run_now = False
+                self._safe_check_function()
+            elif time.monotonic() >= self._next_fire:
+                self._safe_check_function()
+                self._schedule_next()
+
     def _safe_check_function(self) -> None:
         """Wrapper for check function with error handling.
 
@@ -91,15 +149,12 @@ class PlaylistScheduler:
     def trigger_immediate_check(self) -> None:
         """Trigger an immediate check (outside of schedule).
 
-        This runs the check function in the scheduler's thread pool.
+        The check runs on the scheduler's thread, after any check in progress.
         """
         try:
             self.logger.info("Triggering immediate check")
-            self.scheduler.add_job(
-                self._safe_check_function,
-                id="manual_check",
-                replace_existing=True
-            )
+            self._run_now = True
+            self._wake.set()
         except Exception as e:
             self.logger.error(f"Failed to trigger immediate check: {e}")
 
@@ -109,18 +164,21 @@ class PlaylistScheduler:
         Returns:
             Next run time as string, or None if scheduler not running
         """
-        try:
-            job = self.scheduler.get_job(self._job_id)
-            if job and job.next_run_time:
-                return str(job.next_run_time)
-            return None
-        except Exception:
+        if not self.is_running():
             return None
 
+        remaining = max(0.0, self._next_fire - time.monotonic())
+        next_run = datetime.now().astimezone() + timedelta(seconds=remaining)
+        return str(next_run.replace(microsecond=0))
+
     def is_running(self) -> bool:
         """Check if scheduler is running.
 
         Returns:
             True if running
         """
-        return self.scheduler.running
+        return (
+            self._thread is not None
+            and self._thread.is_alive()
+            and not self._stopping.is_set()
+        )
@@ -16,7 +16,7 @@ class DownloadStatus(str, Enum):
     RETRYING = "retrying"
 
 
-@dataclass
+@dataclass(slots=True)
 class Download:
     """Download record model."""
 
@@ -30,5 +30,6 @@ class Download:
 
     def __post_init__(self):
         """Convert status to enum if it's a string."""
-        if isinstance(self.status, str):
+        # DownloadStatus members are str instances too; skip the lookup for them
+        if type(self.status) is str:
             self.status = DownloadStatus(self.status)
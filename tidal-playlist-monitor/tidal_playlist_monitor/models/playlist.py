@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Playlist:
     """Playlist metadata model."""
 
@@ -17,3 +17,4 @@ class Playlist:
     track_count: int = 0
     enabled: bool = True
     created_at: Optional[datetime] = None
+    last_updated: Optional[datetime] = None  # When last modified on TIDAL, as of the last check
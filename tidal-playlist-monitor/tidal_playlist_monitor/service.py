@@ -1,21 +1,37 @@
 """Main background service for TIDAL Playlist Monitor."""
 
+import os
 import signal
-import sys
+import socket
+import threading
 import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
-import tidalapi
+import orjson
 
 from .config.database import DatabaseHandler
 from .config.settings import Settings
 from .core.downloader import TidalDownloader
-from .core.monitor import PlaylistMonitor
 from .core.notifier import Notifier
 from .core.scheduler import PlaylistScheduler
+from .models.track import Track
 from .utils.logger import setup_logger
 from .utils.platform import is_windows
+from .utils.token import expiry_timestamp
+
+# tidalapi (and the monitor, which needs it) pulls in requests and its
+# dependencies, so it is only imported once the TIDAL session is created
+if TYPE_CHECKING:
+    import tidalapi
+
+    from .core.monitor import PlaylistMonitor
+
+# Access tokens are refreshed once they are this close to expiry
+_TOKEN_REFRESH_MARGIN_SEC = 300
+
+# How long shutdown waits for a running check and its downloads to finish
+_SHUTDOWN_TIMEOUT_SEC = 60
 
 
 class TidalPlaylistService:
@@ -28,6 +44,10 @@ class TidalPlaylistService:
             config_path: Path to configuration file (optional)
         """
         self.running = False
+        # Set by the signal handlers; the main thread then runs shutdown()
+        self._stop_event = threading.Event()
+        # Whether the main thread is waiting in _keep_alive()
+        self._waiting = False
         self.config_path = config_path
 
         # Load settings
@@ -46,25 +66,26 @@ class TidalPlaylistService:
 
         # Initialize components
         self.db = DatabaseHandler(self.settings.database.path)
-        self.session: Optional[tidalapi.Session] = None
-        self.monitor: Optional[PlaylistMonitor] = None
+        self.session: Optional['tidalapi.Session'] = None
+        self.monitor: Optional['PlaylistMonitor'] = None
         self.downloader: Optional[TidalDownloader] = None
         self.notifier: Optional[Notifier] = None
         self.scheduler: Optional[PlaylistScheduler] = None
 
     def init_tidal_session(self) -> None:
         """Initialize and authenticate TIDAL session."""
+        import tidalapi
+
         self.logger.info("Initializing TIDAL session")
 
         self.session = tidalapi.Session()
         token_path = self.settings.tidal.token_path
 
         # Try to load existing token
-        if token_path and token_path.exists():
+        if token_path:
             try:
-                import json
-                with open(token_path, 'r') as f:
-                    token_data = json.load(f)
+                # A missing file just means no token yet
+                token_data = orjson.loads(token_path.read_bytes())
 
                 # Load the session with token data
                 self.session.load_oauth_session(
@@ -74,11 +95,16 @@ class TidalPlaylistService:
                     token_data.get('expiry_time')
                 )
 
+                # Refresh an expired token up front instead of on a failed request
+                self.refresh_token_if_due()
+
                 if self.session.check_login():
                     self.logger.info("Loaded existing TIDAL session")
                     return
+            except FileNotFoundError:
+                pass
             except Exception as e:
-                self.logger.warning(f"Failed to load existing token: {e}")
+                self.logger.warning("Failed to load existing token: %s", e)
 
         # Need to authenticate
         self.logger.warning("TIDAL authentication required")
@@ -86,57 +112,77 @@ class TidalPlaylistService:
 
         self.session.login_oauth_simple()
 
-        # Save token manually
-        if token_path:
-            token_path.parent.mkdir(parents=True, exist_ok=True)
+        self.save_token()
+
+    def _token_expiry(self) -> Optional[float]:
+        """Get the session's token expiry as a POSIX timestamp.
+
+        Returns:
+            Expiry timestamp, or None if unknown
+        """
+        return expiry_timestamp(self.session.expiry_time)
+
+    def save_token(self) -> None:
+        """Save the session's token to the configured token file."""
+        token_path = self.settings.tidal.token_path
+        if not token_path:
+            return
 
-            import json
-            token_data = {
-                'token_type': self.session.token_type,
-                'access_token': self.session.access_token,
-                'refresh_token': self.session.refresh_token,
-                'expiry_time': self.session.expiry_time.timestamp() if hasattr(self.session.expiry_time, 'timestamp') else self.session.expiry_time
-            }
+        token_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(token_path, 'w') as f:
-                json.dump(token_data, f, indent=2)
+        token_data = {
+            'token_type': self.session.token_type,
+            'access_token': self.session.access_token,
+            'refresh_token': self.session.refresh_token,
+            'expiry_time': self._token_expiry()
+        }
 
-            self.logger.info(f"Token saved to {token_path}")
+        # Write to a temp file and rename so an interrupted save never leaves a partial token
+        tmp_path = token_path.with_suffix(token_path.suffix + '.tmp')
+        tmp_path.write_bytes(orjson.dumps(token_data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, token_path)
+
+        self.logger.info("Token saved to %s", token_path)
+
+    def refresh_token_if_due(self) -> None:
+        """Refresh the access token if it expires soon, and save the new one.
+
+        Without this, tidalapi only refreshes after a request fails with an
+        expired token, and never writes the new token to disk.
+        """
+        expiry = self._token_expiry()
+        if expiry is None or expiry - time.time() > _TOKEN_REFRESH_MARGIN_SEC:
+            return
+
+        if not self.session.refresh_token:
+            return
+
+        try:
+            self.logger.info("Refreshing TIDAL access token")
+            if self.session.token_refresh(self.session.refresh_token):
+                self.save_token()
+            else:
+                self.logger.warning("TIDAL refresh token has expired")
+        except Exception as e:
+            self.logger.warning("Failed to refresh TIDAL access token: %s", e)
 
     def check_and_download(self) -> None:
         """Main job: check playlists and download new tracks."""
         try:
             self.logger.info("=== Starting scheduled playlist check ===")
 
-            # Check all playlists
-            results = self.monitor.check_all_playlists()
-
-            # Collect all new tracks
-            all_new_tracks = []
-            for playlist_id, new_tracks in results.items():
-                if new_tracks:
-                    playlist = self.db.get_playlist(playlist_id)
-                    playlist_name = playlist.name if playlist else playlist_id
-
-                    self.logger.info(
-                        f"Found {len(new_tracks)} new track(s) in '{playlist_name}'"
-                    )
-
-                    # Send notification
-                    if self.settings.notifications.on_new_tracks:
-                        self.notifier.notify_new_tracks(len(new_tracks), playlist_name)
+            # Refreshed here, before the concurrent checks start, so they never
+            # race to refresh the same expired token
+            self.refresh_token_if_due()
 
-                    all_new_tracks.extend(new_tracks)
+            # Check all playlists and download new tracks; downloads start
+            # while the remaining playlists are still being checked
+            download_results = self.downloader.download_batch(self._iter_new_tracks())
 
-            if not all_new_tracks:
+            if not download_results['success'] and not download_results['failed']:
                 self.logger.info("No new tracks found")
                 return
 
-            # Download new tracks
-            self.logger.info(f"Starting download of {len(all_new_tracks)} track(s)")
-
-            download_results = self.downloader.download_batch(all_new_tracks)
-
             # Send completion notification
             if self.settings.notifications.on_download_complete:
                 self.notifier.notify_download_complete(
@@ -147,18 +193,51 @@ class TidalPlaylistService:
             self.logger.info("=== Scheduled check complete ===")
 
         except Exception as e:
-            self.logger.error(f"Error in check_and_download: {e}", exc_info=True)
+            self.logger.error("Error in check_and_download: %s", e, exc_info=True)
 
             # Send error notification if enabled
             if self.settings.notifications.on_error:
                 self.notifier.notify_error(str(e))
 
+    def _iter_new_tracks(self) -> Iterator[Track]:
+        """Check all playlists, yielding new tracks as each check finishes.
+
+        New tracks are reported in a single notification after the last check.
+
+        Yields:
+            New tracks, after they have been logged for their playlist
+        """
+        notification_batch = []
+
+        for playlist, new_tracks in self.monitor.iter_check_results():
+            if not new_tracks:
+                continue
+
+            self.logger.info(
+                "Found %d new track(s) in '%s'", len(new_tracks), playlist.name
+            )
+            notification_batch.append((playlist.name, len(new_tracks)))
+
+            self.logger.info("Starting download of %d track(s)", len(new_tracks))
+            yield from new_tracks
+
+        # One notification for all playlists once every check has finished
+        if notification_batch and self.settings.notifications.on_new_tracks:
+            self.notifier.notify_new_tracks_batch(notification_batch)
+
     def setup_signal_handlers(self) -> None:
         """Setup signal handlers for graceful shutdown."""
 
         def signal_handler(signum, frame):
-            self.logger.info(f"Received signal {signum}, shutting down...")
-            self.shutdown()
+            # Only request the shutdown: stopping the scheduler waits for a
+            # running check, which must not happen inside a signal handler
+            self.logger.info("Received signal %s, shutting down...", signum)
+            self._stop_event.set()
+
+            # Before the main loop is waiting, interrupt whatever start() is
+            # blocked in (e.g. the login wait); start() then shuts down
+            if not self._waiting:
+                raise SystemExit(0)
 
         # Windows uses SIGBREAK, Linux/macOS use SIGTERM
         signal.signal(signal.SIGINT, signal_handler)
@@ -172,6 +251,7 @@ class TidalPlaylistService:
         """Start the monitoring service."""
         try:
             self.running = True
+            self._stop_event.clear()
 
             # Setup signal handlers
             self.setup_signal_handlers()
@@ -184,7 +264,14 @@ class TidalPlaylistService:
                 raise RuntimeError("TIDAL authentication required")
 
             # Initialize components
-            self.monitor = PlaylistMonitor(self.session, self.db, self.logger)
+            from .core.monitor import PlaylistMonitor
+
+            self.monitor = PlaylistMonitor(
+                self.session,
+                self.db,
+                self.logger,
+                max_concurrent_checks=self.settings.scheduler.max_concurrent_checks
+            )
 
             self.downloader = TidalDownloader(
                 db=self.db,
@@ -194,7 +281,8 @@ class TidalPlaylistService:
                 skip_existing=self.settings.download.skip_existing,
                 max_retries=self.settings.download.max_retries,
                 retry_delay=self.settings.download.retry_delay,
-                delay_between_downloads=self.settings.download.delay_between_downloads
+                delay_between_downloads=self.settings.download.delay_between_downloads,
+                max_concurrent_downloads=self.settings.download.max_concurrent_downloads
             )
 
             self.notifier = Notifier(
@@ -212,6 +300,12 @@ class TidalPlaylistService:
                 self.logger.info("Please run: tidal-dl-ng login")
                 raise RuntimeError("tidal-dl-ng authentication required")
 
+            # A signal during startup raises SystemExit, but a library call
+            # that swallows it would let startup carry on; don't start
+            # checks once a stop has been requested
+            if self._stop_event.is_set():
+                return
+
             # Create scheduler
             self.scheduler = PlaylistScheduler(
                 logger=self.logger,
@@ -226,42 +320,54 @@ class TidalPlaylistService:
 
             next_run = self.scheduler.get_next_run_time()
             if next_run:
-                self.logger.info(f"Next check scheduled for: {next_run}")
+                self.logger.info("Next check scheduled for: %s", next_run)
 
             self.logger.info("Service started successfully")
             self.logger.info("Press Ctrl+C to stop")
 
-            # Run initial check
+            # Run initial check on the scheduler's thread, so the main thread
+            # is free to handle shutdown signals straight away
             self.logger.info("Running initial check...")
-            self.check_and_download()
+            self.scheduler.trigger_immediate_check()
 
-            # Keep service alive
+            # Keep service alive until a shutdown signal is received
             self._keep_alive()
 
-        except KeyboardInterrupt:
-            self.logger.info("Keyboard interrupt received")
-            self.shutdown()
         except Exception as e:
-            self.logger.error(f"Service error: {e}", exc_info=True)
-            self.shutdown()
+            self.logger.error("Service error: %s", e, exc_info=True)
             raise
+        finally:
+            self.shutdown()
 
     def _keep_alive(self) -> None:
-        """Keep the service alive.
+        """Keep the service alive until a shutdown signal is received.
 
-        Windows doesn't support signal.pause(), so we use a sleep loop.
+        The main thread blocks reading a socket that Python's low-level signal
+        handler writes to, so it only wakes up when a signal arrives. Unlike
+        signal.pause(), this works on Windows, and a signal that arrives just
+        before the wait starts still wakes it.
         """
-        if is_windows():
-            # Windows: use while loop with sleep
-            while self.running:
-                time.sleep(1)
-        else:
-            # Linux/macOS: use signal.pause()
-            while self.running:
-                signal.pause()
+        reader, writer = socket.socketpair()
+        writer.setblocking(False)
+        previous_fd = signal.set_wakeup_fd(writer.fileno(), warn_on_full_buffer=False)
+        self._waiting = True
+        try:
+            while not self._stop_event.is_set():
+                # Returns once a signal is received; its handler runs right after
+                reader.recv(64)
+        finally:
+            self._waiting = False
+            signal.set_wakeup_fd(previous_fd)
+            reader.close()
+            writer.close()
 
     def shutdown(self) -> None:
-        """Graceful shutdown."""
+        """Graceful shutdown.
+
+        Waits up to _SHUTDOWN_TIMEOUT_SEC for a running check to finish its
+        downloads. Downloads still in progress after that are abandoned when
+        the process exits.
+        """
         if not self.running:
             return
 
@@ -270,13 +376,10 @@ class TidalPlaylistService:
 
         # Stop scheduler
         if self.scheduler:
-            self.scheduler.stop()
+            self.scheduler.stop(timeout=_SHUTDOWN_TIMEOUT_SEC)
 
         self.logger.info("Service stopped")
 
-        # Exit
-        sys.exit(0)
-
 
 def main():
     """Main entry point."""
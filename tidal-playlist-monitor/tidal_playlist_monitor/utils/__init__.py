@@ -2,5 +2,12 @@
 
 from .logger import setup_logger
 from .platform import get_config_dir, get_default_download_dir, is_windows
+from .token import expiry_timestamp
 
-__all__ = ["setup_logger", "get_config_dir", "get_default_download_dir", "is_windows"]
+__all__ = [
+    "setup_logger",
+    "get_config_dir",
+    "get_default_download_dir",
+    "is_windows",
+    "expiry_timestamp",
+]
@@ -1,12 +1,35 @@
 """Logging configuration for TIDAL Playlist Monitor."""
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
-import coloredlogs
+try:
+    # Locks the log file across processes, so rotation also works on Windows
+    # while another process (e.g. a log viewer or the CLI) has the file open
+    from concurrent_log_handler import ConcurrentRotatingFileHandler as _FileHandler
+except ImportError:
+    _FileHandler = RotatingFileHandler
+
+# Background listeners that write each configured logger's records, by logger name
+_listeners: Dict[str, QueueListener] = {}
+
+# Arguments each logger was last set up with, by logger name
+_configured: Dict[str, Tuple] = {}
+
+
+def _stop_listeners() -> None:
+    """Stop all listeners, writing out any records still queued."""
+    while _listeners:
+        _listeners.popitem()[1].stop()
+
+
+# Registered after logging's own shutdown hook, so it runs before handlers are closed
+atexit.register(_stop_listeners)
 
 
 def setup_logger(
@@ -19,6 +42,11 @@ def setup_logger(
 ) -> logging.Logger:
     """Set up a logger with file and console handlers.
 
+    The logger itself only queues records; a listener thread formats them and
+    writes them to the handlers, so file writes and log rotation never block
+    the thread that logs. Calling it again with the same arguments returns
+    the logger as already configured.
+
     Args:
         name: Logger name
         log_file: Path to log file (if None, no file logging)
@@ -31,36 +59,61 @@ def setup_logger(
         Configured logger instance
     """
     logger = logging.getLogger(name)
+
+    key = (log_file and str(log_file), level.upper(), max_size_mb, backup_count, console)
+    if _configured.get(name) == key:
+        return logger
+
     logger.setLevel(getattr(logging, level.upper()))
     logger.handlers.clear()  # Clear any existing handlers
 
+    # Flush and stop the listener of an earlier setup of this logger
+    previous = _listeners.pop(name, None)
+    if previous:
+        previous.stop()
+        for handler in previous.handlers:
+            handler.close()
+
+    handlers = []
+
     # Create formatters
     file_formatter = logging.Formatter(
         fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
-    console_formatter = coloredlogs.ColoredFormatter(
-        fmt='%(asctime)s - %(levelname)s - %(message)s',
-        datefmt='%H:%M:%S'
-    )
-
     # Add file handler if log_file is specified
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = RotatingFileHandler(
+        file_handler = _FileHandler(
             log_file,
             maxBytes=max_size_mb * 1024 * 1024,
             backupCount=backup_count,
             encoding='utf-8'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
     # Add console handler
     if console:
+        # Only console output needs coloredlogs, which is slow to import
+        import coloredlogs
+
+        console_formatter = coloredlogs.ColoredFormatter(
+            fmt='%(asctime)s - %(levelname)s - %(message)s',
+            datefmt='%H:%M:%S'
+        )
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _listeners[name] = listener
 
+    _configured[name] = key
     return logger
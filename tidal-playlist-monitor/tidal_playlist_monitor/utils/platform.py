@@ -2,27 +2,36 @@
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+# The platform cannot change while the process runs
+_IS_WINDOWS = sys.platform == 'win32' or os.name == 'nt'
+_IS_MACOS = sys.platform == 'darwin'
+_IS_LINUX = sys.platform.startswith('linux')
+
 
 def is_windows() -> bool:
     """Check if running on Windows."""
-    return sys.platform == 'win32' or os.name == 'nt'
+    return _IS_WINDOWS
 
 
 def is_macos() -> bool:
     """Check if running on macOS."""
-    return sys.platform == 'darwin'
+    return _IS_MACOS
 
 
 def is_linux() -> bool:
     """Check if running on Linux."""
-    return sys.platform.startswith('linux')
+    return _IS_LINUX
 
 
+@lru_cache(maxsize=1)
 def get_config_dir() -> Path:
     """Get the configuration directory based on the platform.
 
+    The directory is resolved and created once per process.
+
     Returns:
         Path: Configuration directory path
             - Windows: %APPDATA%/tidal-playlist-monitor
@@ -41,9 +50,12 @@ def get_config_dir() -> Path:
     return config_dir
 
 
+@lru_cache(maxsize=1)
 def get_default_download_dir() -> Path:
     """Get the default download directory based on the platform.
 
+    The directory is resolved and created once per process.
+
     Returns:
         Path: Default download directory
             - Windows: ~/Music/TIDAL
@@ -0,0 +1,29 @@
+"""Helpers for TIDAL OAuth tokens shared by the service and the CLI."""
+
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+
+def expiry_timestamp(expiry: Union[datetime, float, None]) -> Optional[float]:
+    """Convert a token expiry to a POSIX timestamp.
+
+    Both the service and the CLI write the token file with this, so they
+    agree on what the stored expiry means.
+
+    Args:
+        expiry: Session expiry_time (tidalapi sets a naive datetime in UTC)
+            or an expiry timestamp read back from the token file
+
+    Returns:
+        Expiry timestamp, or None if unknown
+    """
+    if isinstance(expiry, datetime):
+        # Naive datetimes are UTC; timestamp() would read them as local time
+        if expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=timezone.utc)
+        return expiry.timestamp()
+
+    if isinstance(expiry, (int, float)):
+        return float(expiry)
+
+    return None